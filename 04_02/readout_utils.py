@@ -16,3 +16,38 @@ def add_readout_pulse_and_execute(platform, ps, opts, qubit, t, expects_list):
     ps.add(ro_pulse)
     expects = platform.execute_pulse_sequence(ps, opts)[ro_pulse.serial].magnitude
     expects_list.append(expects)
+
+
+def execute_and_read_all(platform, ps, opts):
+    """
+    Execute the pulse sequence once and collect every readout it contains.
+
+    Args:
+        platform: Quantum operations platform.
+        ps: Pulse sequence object.
+        opts: Execution parameters.
+
+    Returns:
+        Dictionary mapping the serial of each readout pulse to its magnitude.
+    """
+    results = platform.execute_pulse_sequence(ps, opts)
+    return {ro_pulse.serial: results[ro_pulse.serial].magnitude for ro_pulse in ps.ro_pulses}
+
+
+def add_readout_pulses_and_execute(platform, ps, opts, qubits, t, expects_lists):
+    """
+    Add one readout pulse per qubit and record all of them from a single execution.
+
+    Args:
+        platform: Quantum operations platform.
+        ps: Pulse sequence object.
+        opts: Execution parameters.
+        qubits: Qubits for which readout is performed.
+        t: Time point.
+        expects_lists: Lists to append the results, one per qubit.
+    """
+    ro_pulses = [platform.create_qubit_readout_pulse(qubit=qubit, start=t) for qubit in qubits]
+    ps.add(*ro_pulses)
+    expects = execute_and_read_all(platform, ps, opts)
+    for ro_pulse, expects_list in zip(ro_pulses, expects_lists):
+        expects_list.append(expects[ro_pulse.serial])
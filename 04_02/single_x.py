@@ -40,15 +40,14 @@ x_expects_q1 = []
 x_expects_q2 = []
 
 # Import the function from readout_utils
-from readout_utils import add_readout_pulse_and_execute
+from readout_utils import add_readout_pulses_and_execute
 
 # Measure baseline
 for t in times:
     ps = PulseSequence()
 
-    # Add readout pulse and execute for Q1 and Q2
-    add_readout_pulse_and_execute(platform, ps, opts, Q1, t, baseline_expects_q1)
-    add_readout_pulse_and_execute(platform, ps, opts, Q2, t, baseline_expects_q2)
+    # Add readout pulses and execute once for Q1 and Q2
+    add_readout_pulses_and_execute(platform, ps, opts, [Q1, Q2], t, [baseline_expects_q1, baseline_expects_q2])
 
 # Save baseline results
 np.save('baseline_expects_q1', baseline_expects_q1)
@@ -63,9 +62,8 @@ for t in pulse_times:
     #drive_pulse.amplitude = amplitude
     ps.add(drive_pulse)
 
-    # Add readout pulses and execute for Q1 and Q2
-    add_readout_pulse_and_execute(platform, ps, opts, Q1, t, x_expects_q1)
-    add_readout_pulse_and_execute(platform, ps, opts, Q2, t, x_expects_q2)
+    # Add readout pulses and execute once for Q1 and Q2
+    add_readout_pulses_and_execute(platform, ps, opts, [Q1, Q2], t, [x_expects_q1, x_expects_q2])
 
 # Apply idle pulses and measure
 for t in idle_times:
@@ -76,9 +74,8 @@ for t in idle_times:
     #drive_pulse.amplitude = amplitude
     ps.add(drive_pulse)
 
-    # Add readout pulses and execute for Q1 and Q2
-    add_readout_pulse_and_execute(platform, ps, opts, Q1, t, x_expects_q1)
-    add_readout_pulse_and_execute(platform, ps, opts, Q2, t, x_expects_q2)
+    # Add readout pulses and execute once for Q1 and Q2
+    add_readout_pulses_and_execute(platform, ps, opts, [Q1, Q2], t, [x_expects_q1, x_expects_q2])
 
 # Save X pulse results
 np.save('x_expects_q1', x_expects_q1)
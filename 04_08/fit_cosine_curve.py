@@ -1,17 +1,139 @@
+import sys
+from pathlib import Path
+
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
 
-def fit_cosine_curve(x_data, y_data):
-    # Define the model function
-    def cosine_func(x, A, w, t_0, A_0):
-        return A * np.cos(w * (x - t_0)) + A_0
+# the cosine model lives in pulse_reversal/cosine_model.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "pulse_reversal"))
+from cosine_model import cosine as cosine_func  # noqa: E402
+from cosine_model import cosine_jacobian  # noqa: E402
+
+
+def _columns(params):
+    """Parameters of every trace as columns, broadcasting against the points."""
+    return (params[:, i, None] for i in range(4))
+
+
+def _evaluate(x, params):
+    return cosine_func(x, *_columns(params))
+
+
+def seed_cosine_batch(x_data, y_data):
+    """Initial parameters of every trace.
+
+    The frequency and phase are those of the largest non constant bin of the
+    FFT, the amplitude and offset come from the minimum and maximum of the
+    trace. Unevenly spaced points are interpolated on a regular grid first.
+
+    Args:
+        x_data: Sweep points, shared by all traces, of shape ``(n_points,)``.
+        y_data: Traces of shape ``(n_traces, n_points)``.
+
+    Returns:
+        Array of shape ``(n_traces, 4)`` with ``A``, ``w``, ``t_0`` and ``A_0``.
+    """
+    x_data = np.asarray(x_data, dtype=float)
+    y_data = np.atleast_2d(np.asarray(y_data, dtype=float))
+    step = np.diff(x_data)
+    if not np.allclose(step, step[0]):
+        grid = np.linspace(x_data[0], x_data[-1], len(x_data))
+        y_data = np.stack([np.interp(grid, x_data, trace) for trace in y_data])
+        step = grid[1] - grid[0]
+    else:
+        step = step[0]
+
+    maximum = y_data.max(axis=1)
+    minimum = y_data.min(axis=1)
+    spectrum = np.fft.rfft(y_data - y_data.mean(axis=1, keepdims=True), axis=1)
+    power = np.abs(spectrum[:, 1:])
+    peak = np.argmax(power, axis=1)
+    # parabolic interpolation of the peak, between the FFT bins
+    left = power[np.arange(len(peak)), np.maximum(peak - 1, 0)]
+    centre = power[np.arange(len(peak)), peak]
+    right = power[np.arange(len(peak)), np.minimum(peak + 1, power.shape[1] - 1)]
+    curvature = left - 2 * centre + right
+    shift = np.divide(
+        0.5 * (left - right), curvature, out=np.zeros_like(centre), where=curvature < 0
+    )
+    frequency = (peak + 1 + np.clip(shift, -0.5, 0.5)) / (len(x_data) * step)
+
+    w = 2 * np.pi * frequency
+    phase = np.angle(spectrum[np.arange(len(peak)), peak + 1])
+    # y ~ cos(w * (x - x_0) + phase), that is t_0 = x_0 - phase / w
+    t_0 = x_data[0] - phase / w
+    return np.stack([(maximum - minimum) / 2, w, t_0, (maximum + minimum) / 2], axis=1)
 
+
+def fit_cosine_batch(x_data, y_data, p0=None, max_iterations=200, tolerance=1e-10):
+    """Fit :func:`cosine_func` to many traces at once with Levenberg-Marquardt.
+
+    All traces share the sweep points and are solved together, each with its
+    own damping, so e.g. the 12 cross resonance pairs in both control states
+    are analysed in a single call.
+
+    Args:
+        x_data: Sweep points of shape ``(n_points,)``.
+        y_data: Traces of shape ``(n_traces, n_points)``.
+        p0: Initial parameters of shape ``(n_traces, 4)``, by default from
+            :func:`seed_cosine_batch`.
+        max_iterations (int): Maximum number of Levenberg-Marquardt steps.
+        tolerance (float): Relative decrease of the squared residuals below
+            which a trace is converged.
+
+    Returns:
+        The fitted parameters, of shape ``(n_traces, 4)``, and their
+        covariances, of shape ``(n_traces, 4, 4)``.
+    """
+    x_data = np.asarray(x_data, dtype=float)
+    y_data = np.atleast_2d(np.asarray(y_data, dtype=float))
+    params = seed_cosine_batch(x_data, y_data) if p0 is None else np.array(p0, float)
+    params = np.atleast_2d(params)
+
+    cost = np.sum((y_data - _evaluate(x_data, params)) ** 2, axis=1)
+    damping = np.full(len(params), 1e-3)
+    active = np.ones(len(params), dtype=bool)
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        current = params[active]
+        jacobian = cosine_jacobian(x_data, *_columns(current))
+        residuals = y_data[active] - _evaluate(x_data, current)
+        jtj = np.einsum("tpi,tpj->tij", jacobian, jacobian)
+        gradient = np.einsum("tpi,tp->ti", jacobian, residuals)
+
+        diagonal = np.diagonal(jtj, axis1=1, axis2=2)
+        scaled = damping[active, None] * np.maximum(diagonal, 1e-12)
+        step = np.linalg.solve(
+            jtj + scaled[:, :, None] * np.eye(4), gradient[:, :, None]
+        )[:, :, 0]
+        candidate = current + step
+        new_cost = np.sum((y_data[active] - _evaluate(x_data, candidate)) ** 2, axis=1)
+
+        improved = new_cost < cost[active]
+        indices = np.flatnonzero(active)
+        converged = improved & (cost[active] - new_cost <= tolerance * cost[active])
+        accepted = indices[improved]
+        params[accepted] = candidate[improved]
+        cost[accepted] = new_cost[improved]
+        damping[indices] = np.where(
+            improved, damping[indices] / 10, damping[indices] * 10
+        )
+        # stop traces that converged or cannot move anymore
+        active[indices[converged | (damping[indices] > 1e10)]] = False
+
+    jacobian = cosine_jacobian(x_data, *_columns(params))
+    jtj = np.einsum("tpi,tpj->tij", jacobian, jacobian)
+    variance = cost / max(len(x_data) - 4, 1)
+    covariance = np.linalg.pinv(jtj) * variance[:, None, None]
+    return params, covariance
+
+
+def fit_cosine_curve(x_data, y_data):
     # Perform curve fitting
-    params, covariance = curve_fit(cosine_func, x_data, y_data, p0=[-4000, 0.323, -164, 60000])
+    params, covariance = fit_cosine_batch(x_data, y_data)
 
     # Extracting fitted parameters
-    A_fit, w_fit, t_0_fit, A_0_fit = params
+    A_fit, w_fit, t_0_fit, A_0_fit = params[0]
 
     # Generate fitted curve
     y_fit = cosine_func(x_data, A_fit, w_fit, t_0_fit, A_0_fit)
@@ -24,4 +146,3 @@ def fit_cosine_curve(x_data, y_data):
     print("Vertical Shift (A_0):", A_0_fit)
 
     return y_fit, cosine_func
-
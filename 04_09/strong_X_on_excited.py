@@ -1,6 +1,5 @@
 # Importing necessary libraries
 import numpy as np
-import matplotlib.pyplot as plt
 from qibolab import create_platform, ExecutionParameters, AveragingMode, AcquisitionType
 from qibolab.pulses import Pulse, ReadoutPulse, PulseSequence, Drag
 from tqdm import tqdm
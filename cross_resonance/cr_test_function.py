@@ -9,9 +9,12 @@ opts = ExecutionParameters(
     averaging_mode=AveragingMode.SEQUENTIAL
 )
 
-def cr_pulse_run(CRTL,TGT):
-    platform = create_platform("icarusq_iqm5q")
-    platform.connect()
+def cr_pulse_run(CRTL,TGT,platform=None):
+    # a platform given by the caller, e.g. from a session, stays connected
+    owned = platform is None
+    if owned:
+        platform = create_platform("icarusq_iqm5q")
+        platform.connect()
 
     sweep = np.arange(0, 2000, 500)
     res1 = np.zeros(len(sweep))
@@ -37,5 +40,5 @@ def cr_pulse_run(CRTL,TGT):
 
     np.save(f"./data/crtl_0_cr_{CRTL}{TGT}", res1)
     np.save(f"./data/crtl_1_cr_{CRTL}{TGT}", res2)
-    platform.disconnect()
-    platform  = None
+    if owned:
+        platform.disconnect()
@@ -1,30 +1,15 @@
+import sys
+from pathlib import Path
+
 from cr_test_function import *
-for CRTL in range(4):
-    for TGT in range(4):
-        if TGT != CRTL:
-            print(f'CRTL = {CRTL}\nTGT = {TGT}')
 
-CRTL = 0
-TGT = 1
-CRTL = 0
-TGT = 2
-CRTL = 0
-TGT = 3
-CRTL = 1
-TGT = 0
-CRTL = 1
-TGT = 2
-CRTL = 1
-TGT = 3
-CRTL = 2
-TGT = 0
-CRTL = 2
-TGT = 1
-CRTL = 2
-TGT = 3
-CRTL = 3
-TGT = 0
-CRTL = 3
-TGT = 1
-CRTL = 3
-TGT = 2
\ No newline at end of file
+# the platform session lives in pulse_reversal/session.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "pulse_reversal"))
+from session import PlatformSession
+
+with PlatformSession("icarusq_iqm5q") as session:
+    for CRTL in range(4):
+        for TGT in range(4):
+            if TGT != CRTL:
+                print(f'CRTL = {CRTL}\nTGT = {TGT}')
+                cr_pulse_run(CRTL, TGT, platform=session.platform)
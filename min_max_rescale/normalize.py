@@ -1,27 +1,144 @@
+"""Min-max normalization of readout data to the range -1 to 1.
+
+All functions work on NumPy arrays, including memory-mapped ones, which
+are rescaled in place without temporary copies. :class:`RunningMinMax`
+accumulates the range of many arrays, so a directory of results can be
+rescaled against a shared range while keeping one file in memory at a time.
+
+Example:
+    .. code-block:: python
+
+        paths = sorted(Path("CR_data").glob("*.npy"))
+        normalize_files(paths, [Path("CR_normalized") / p.name for p in paths])
+"""
+
+from pathlib import Path
+
 import numpy as np
 
-def min_max_finder(data):   
-    return min(data), max(data)
 
-def min_max_finder_2(data1,data2):
-    # Find the minimum and maximum values in the data
-    min_val = min(np.append(data1,data2))
-    max_val = max(np.append(data1,data2))
-    
-    return min_val, max_val
+class RunningMinMax:
+    """Minimum and maximum of all the data seen so far."""
+
+    def __init__(self):
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, data):
+        data = np.asarray(data)
+        if data.size == 0:
+            return self
+        self.min = min(self.min, data.min())
+        self.max = max(self.max, data.max())
+        return self
+
+    @classmethod
+    def from_files(cls, paths):
+        """Range of ``.npy`` files, memory-mapped one at a time."""
+        running = cls()
+        for path in paths:
+            running.update(np.load(path, mmap_mode="r"))
+        return running
+
+    @property
+    def range(self):
+        return self.min, self.max
+
+
+def min_max_finder(data):
+    return RunningMinMax().update(data).range
+
+
+def min_max_finder_2(*data):
+    # Find the minimum and maximum values of all the data, without joining it
+    running = RunningMinMax()
+    for array in data:
+        running.update(array)
+    return running.range
+
 
-def min_max_normalize(min_val, max_val, data):
+def min_max_normalize(min_val, max_val, data, out=None):
     """
     Normalize data to the range -1 to 1 using Min-Max scaling.
-    
+
     Args:
-    - data: List, array, or any iterable containing the data to be normalized
-    
+    - min_val, max_val: Values mapped to -1 and 1, scalars or arrays
+      broadcasting with the data
+    - data: Array, or any iterable containing the data to be normalized
+    - out: Array receiving the result, may be ``data`` itself to normalize
+      a float array or memory map in place
+
     Returns:
-    - List: Normalized data
+    - Array: Normalized data
     """
-    
-    # Normalize each value in the data to the range -1 to 1
-    normalized_data = [((x - min_val) / (max_val - min_val)) * 2 - 1 for x in data]
-    
-    return normalized_data
\ No newline at end of file
+    data = np.asarray(data)
+    if out is None:
+        out = np.empty(np.broadcast(min_val, max_val, data).shape, float)
+    # in place operations avoid temporaries of the size of the data
+    np.subtract(data, min_val, out=out)
+    np.multiply(out, 2 / (np.asarray(max_val) - min_val), out=out)
+    np.subtract(out, 1, out=out)
+    return out
+
+
+def normalize_to_minus_one_one(data1, data2):
+    """Normalize two datasets to -1 to 1 with their common range."""
+    min_val, max_val = min_max_finder_2(data1, data2)
+    return (
+        min_max_normalize(min_val, max_val, data1),
+        min_max_normalize(min_val, max_val, data2),
+    )
+
+
+def normalize_files(paths, out_paths):
+    """Normalize ``.npy`` files against the range of all of them.
+
+    The files are memory-mapped, so only one file is read at a time, once to
+    find the shared range and once to rescale it. Nothing is written before
+    every file has been read and checked.
+
+    Args:
+    - paths: ``.npy`` files holding the data
+    - out_paths: Files receiving the normalized data, one per input file.
+      Giving an input file as its own output normalizes it in place, which
+      needs float data
+
+    Returns:
+    - Tuple: Shared minimum and maximum
+    """
+    paths = [Path(path) for path in paths]
+    out_paths = [Path(out_path) for out_path in out_paths]
+    if len(out_paths) != len(paths):
+        raise ValueError(f"Got {len(out_paths)} output files for {len(paths)} inputs.")
+    # the same file may be given through different paths
+    inputs = [path.resolve() for path in paths]
+    in_place = []
+    for path, out_path in zip(inputs, out_paths):
+        out_path = out_path.resolve()
+        if out_path != path and out_path in inputs:
+            raise ValueError(f"{out_path} would be overwritten before it is read.")
+        in_place.append(out_path == path)
+
+    running = RunningMinMax()
+    for path, overwrite in zip(paths, in_place):
+        data = np.load(path, mmap_mode="r")
+        if overwrite and not np.issubdtype(data.dtype, np.floating):
+            raise TypeError(
+                f"{path} holds {data.dtype} data and cannot be normalized in "
+                "place, give another output file."
+            )
+        running.update(data)
+    min_val, max_val = running.range
+
+    for path, out_path, overwrite in zip(paths, out_paths, in_place):
+        if overwrite:
+            data = out = np.load(path, mmap_mode="r+")
+        else:
+            data = np.load(path, mmap_mode="r")
+            dtype = np.result_type(data.dtype, float)
+            out = np.lib.format.open_memmap(
+                out_path, mode="w+", dtype=dtype, shape=data.shape
+            )
+        min_max_normalize(min_val, max_val, data, out=out)
+        out.flush()
+    return min_val, max_val
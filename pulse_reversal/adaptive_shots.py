@@ -0,0 +1,60 @@
+"""Running statistics of single shots acquired in chunks."""
+
+import numpy as np
+
+from qibolab.result import AveragedIntegratedResults, AveragedSampleResults
+
+
+def shot_values(result) -> np.ndarray:
+    """Single shot values of a readout, complex voltages or samples."""
+    if hasattr(result, "voltage"):
+        return np.ravel(result.voltage)
+    return np.ravel(result.samples)
+
+
+class RunningMean:
+    """Mean and variance of the shots of a readout pulse, updated with each
+    chunk without keeping the shots.
+
+    Chunks are merged with the parallel form of Welford's algorithm, so the
+    variance is accurate even when the mean is large compared to the noise.
+    Complex voltages use the variance of the distance to the mean, the sum
+    of the variances of their components.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0
+        self.m2 = 0.0
+        """Sum of squared distances to the mean."""
+
+    def update(self, values):
+        values = np.asarray(values)
+        count = len(values)
+        if count == 0:
+            return
+        mean = values.mean()
+        m2 = np.sum(np.abs(values - mean) ** 2)
+
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * count / total
+        self.m2 += m2 + np.abs(delta) ** 2 * self.count * count / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            return np.inf
+        return self.m2 / (self.count - 1)
+
+    @property
+    def error(self) -> float:
+        """Standard error of the mean."""
+        return np.sqrt(self.variance / self.count) if self.count else np.inf
+
+    def result(self):
+        """Averaged results, as returned for cyclic averaging."""
+        if np.iscomplexobj(self.mean):
+            return AveragedIntegratedResults(np.array(self.mean), std=self.error)
+        return AveragedSampleResults(np.array(self.mean), std=self.error)
@@ -0,0 +1,173 @@
+"""Adaptive choice of the sweep points of oscillation experiments.
+
+Instead of measuring every point of a grid such as ``np.arange(0, 5000, 100)``,
+the points are measured in batches. After each batch the cosine model of
+:mod:`cosine_model` is fitted, and the next batch is made of the
+points that reduce the uncertainty on its frequency the most. The sweep
+stops once the frequency is known to the requested precision.
+
+Example:
+    .. code-block:: python
+
+        def measure(durations):
+            sequences = [cr_sequence(platform, t) for t in durations]
+            results = platform.execute_pulse_sequences(sequences, opts)
+            return results[TGT].magnitude
+
+        sweep = adaptive_sweep(np.arange(0, 5000, 100), measure, target_error=1e-4)
+        amplitude, frequency, t_0, offset = sweep.params
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from cosine_model import cosine, cosine_jacobian
+
+
+def seed_cosine(x, y, frequencies):
+    """Initial parameters from the frequency with the smallest least squares
+    residual, which works for unevenly spaced points."""
+    best = None
+    for frequency in frequencies:
+        design = np.stack(
+            [np.cos(frequency * x), np.sin(frequency * x), np.ones_like(x)], axis=-1
+        )
+        coefficients = np.linalg.lstsq(design, y, rcond=None)[0]
+        residual = np.sum((design @ coefficients - y) ** 2)
+        if best is None or residual < best[0]:
+            best = (residual, frequency, coefficients)
+    _, frequency, (a, b, offset) = best
+    return [np.hypot(a, b), frequency, np.arctan2(b, a) / frequency, offset]
+
+
+@dataclass
+class AdaptiveSweep:
+    """Points measured by :func:`adaptive_sweep` and the fitted model."""
+
+    points: np.ndarray
+    """Measured sweep points, in measurement order."""
+    values: np.ndarray
+    """Measured values."""
+    params: Optional[np.ndarray]
+    """Fitted amplitude, angular frequency, t_0 and offset of :func:`cosine`."""
+    covariance: Optional[np.ndarray]
+    """Covariance of the fitted parameters."""
+
+    @property
+    def frequency_error(self) -> float:
+        if self.covariance is None:
+            return np.inf
+        return np.sqrt(self.covariance[1, 1])
+
+
+def _fit(points, values, frequencies):
+    from scipy.optimize import curve_fit
+
+    if len(points) <= 4:
+        return None, None
+    try:
+        params, covariance = curve_fit(
+            cosine, points, values, p0=seed_cosine(points, values, frequencies)
+        )
+    except RuntimeError:
+        return None, None
+    if not np.all(np.isfinite(covariance)):
+        return params, None
+    return params, covariance
+
+
+def _spread(candidates, measured, size):
+    """Candidates farthest from the measured points."""
+    chosen = []
+    reference = list(measured)
+    for _ in range(min(size, len(candidates))):
+        if reference:
+            distance = np.abs(candidates[:, None] - np.array(reference)).min(axis=1)
+        else:
+            distance = np.abs(candidates - candidates.min())
+        distance[chosen] = -1
+        index = int(np.argmax(distance))
+        chosen.append(index)
+        reference.append(candidates[index])
+    return chosen
+
+
+def _informative(candidates, params, covariance, noise, size):
+    """Greedy batch reducing the most the variance of the frequency.
+
+    The posterior covariance is updated after each chosen point, so the
+    points of a batch do not repeat the same information.
+    """
+    jacobian = cosine_jacobian(candidates, *params)
+    covariance = covariance.copy()
+    chosen = []
+    for _ in range(min(size, len(candidates))):
+        projected = jacobian @ covariance
+        predicted = np.einsum("ij,ij->i", projected, jacobian) + noise
+        # information gain on the frequency is log(var_before / var_after)
+        gain = projected[:, 1] ** 2 / predicted
+        gain[chosen] = -1
+        index = int(np.argmax(gain))
+        chosen.append(index)
+        covariance -= np.outer(projected[index], projected[index]) / predicted[index]
+    return chosen
+
+
+def adaptive_sweep(
+    candidates,
+    measure: Callable,
+    target_error: float,
+    batch_size: int = 5,
+    initial_points: Optional[int] = None,
+    max_points: Optional[int] = None,
+) -> AdaptiveSweep:
+    """Measure the candidate points that best determine the oscillation
+    frequency, until its standard error is below ``target_error``.
+
+    Args:
+        candidates: Sweep points that may be measured, e.g. pulse durations.
+        measure (callable): Function measuring a list of points and returning
+            their values, ideally with one batched execution.
+        target_error (float): Standard error on the angular frequency at which
+            the sweep stops.
+        batch_size (int): Number of points measured after each fit.
+        initial_points (int): Number of evenly spread points measured before
+            the first fit. By default a sixth of the candidates, at least 8.
+        max_points (int): Maximum number of measured points, by default all
+            candidates.
+    """
+    candidates = np.unique(np.asarray(candidates, dtype=float))
+    if initial_points is None:
+        initial_points = max(8, len(candidates) // 6)
+    if max_points is None:
+        max_points = len(candidates)
+    # frequencies resolved by the span and the spacing of the candidates
+    span = candidates[-1] - candidates[0]
+    nyquist = np.pi / np.min(np.diff(candidates))
+    frequencies = np.linspace(np.pi / span, nyquist, 4 * len(candidates))
+
+    remaining = candidates
+    points = np.array([])
+    values = np.array([])
+    params = covariance = None
+    while len(remaining) and len(points) < max_points:
+        size = min(max_points - len(points), batch_size)
+        if not len(points):
+            chosen = _spread(remaining, points, min(initial_points, max_points))
+        elif covariance is None:
+            chosen = _spread(remaining, points, size)
+        else:
+            noise = np.mean((cosine(points, *params) - values) ** 2)
+            chosen = _informative(remaining, params, covariance, noise, size)
+
+        batch = remaining[chosen]
+        points = np.concatenate([points, batch])
+        values = np.concatenate([values, np.asarray(measure(batch), dtype=float)])
+        remaining = np.delete(remaining, chosen)
+
+        params, covariance = _fit(points, values, frequencies)
+        if covariance is not None and np.sqrt(covariance[1, 1]) <= target_error:
+            break
+    return AdaptiveSweep(points, values, params, covariance)
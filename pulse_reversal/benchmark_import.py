@@ -0,0 +1,84 @@
+"""Benchmark of the import time of the platform and helper modules.
+
+Each module is imported in a fresh interpreter after qibolab, so only its
+own cost is measured. The script exits with a nonzero status if a module
+takes longer than the budget or loads a module that should only be
+imported on demand.
+
+Usage: python benchmark_import.py [--budget MS] [--repeat N]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "platform_with_RY",
+    "unrolling",
+    "waveform_cache",
+    "sweep_plan",
+    "segments",
+    "result_store",
+    "session",
+    "readout_utils",
+    "result_columns",
+    "qibolab_init",
+    "pair_scheduler",
+    "adaptive_shots",
+    "cosine_model",
+    "adaptive_sweep",
+    "relaxation_tuner",
+]
+ON_DEMAND = ["matplotlib", "tqdm", "scipy.optimize"]
+"""Modules, and their submodules, that no helper module may import at
+startup."""
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--budget", type=float, default=100, help="ms per module")
+parser.add_argument("--repeat", type=int, default=5)
+args = parser.parse_args()
+
+
+def import_time(module):
+    """Cumulative import time in ms of a module, and the modules it loaded."""
+    code = f"import qibolab; import {module}"
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    # modules are listed when their import finishes, those loaded by qibolab
+    # come before qibolab itself
+    output = re.split(r"\|\s*qibolab$", output, maxsplit=1, flags=re.MULTILINE)[-1]
+    loaded = re.findall(r"\|\s*([\w.]+)$", output, re.MULTILINE)
+    match = re.search(rf"\|\s*(\d+) \| {re.escape(module)}$", output, re.MULTILINE)
+    return int(match.group(1)) / 1e3, loaded
+
+
+failed = False
+for module in MODULES:
+    times = []
+    for _ in range(args.repeat):
+        elapsed, loaded = import_time(module)
+        times.append(elapsed)
+    median = statistics.median(times)
+    eager = sorted(
+        {
+            name
+            for name in loaded
+            for lazy in ON_DEMAND
+            if name == lazy or name.startswith(f"{lazy}.")
+        }
+    )
+    status = "ok"
+    if median > args.budget:
+        status = "SLOW"
+    if eager:
+        status = f"EAGER {', '.join(eager)}"
+    failed |= status != "ok"
+    print(f"{module:20s} {median:8.1f} ms  {status}")
+
+sys.exit(1 if failed else 0)
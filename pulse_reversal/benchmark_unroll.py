@@ -0,0 +1,45 @@
+"""Benchmark of ``unroll_sequences`` and of the collection of the results
+for long sweeps.
+
+The time per sequence should stay constant as the number of unrolled
+sequences grows.
+
+Usage: python benchmark_unroll.py
+"""
+
+import time
+from collections import defaultdict
+
+from qibolab.dummy import create_dummy
+from qibolab.pulses import PulseSequence
+
+from platform_with_RY import collect_readouts, unroll_sequences
+
+SIZES = [1000, 2000, 5000, 10000]
+RELAXATION_TIME = 200e3
+
+platform = create_dummy()
+
+for size in SIZES:
+    sequences = []
+    for t in range(size):
+        drive_pulse = platform.create_RX_pulse(qubit=0, start=0)
+        drive_pulse.duration = t % 100 + 1
+        ro_pulse = platform.create_qubit_readout_pulse(qubit=0, start=drive_pulse.finish)
+        sequences.append(PulseSequence(drive_pulse, ro_pulse))
+
+    begin = time.perf_counter()
+    sequence, _, readouts = unroll_sequences(sequences, RELAXATION_TIME)
+    unrolled = time.perf_counter() - begin
+
+    # results of the unrolled sequence, as returned by the controller
+    result = {new_serial: new_serial for _, _, new_serial in readouts}
+    begin = time.perf_counter()
+    collect_readouts(defaultdict(list), result, readouts)
+    collected = time.perf_counter() - begin
+
+    print(
+        f"{size:6d} sequences: unroll {unrolled:.3f} s "
+        f"({1e6 * unrolled / size:.1f} us per sequence), collect {collected:.3f} s "
+        f"({1e6 * collected / size:.2f} us per sequence)"
+    )
@@ -0,0 +1,29 @@
+"""Cosine model of the oscillation experiments, shared by the fits of
+``04_08/fit_cosine_curve.py`` and :mod:`adaptive_sweep`."""
+
+import numpy as np
+
+
+def cosine(x, amplitude, frequency, t_0, offset):
+    """Cosine oscillation, with angular frequency.
+
+    The parameters broadcast against ``x``, e.g. columns of parameters give
+    one row of values per trace.
+    """
+    return amplitude * np.cos(frequency * (x - t_0)) + offset
+
+
+def cosine_jacobian(x, amplitude, frequency, t_0, offset):
+    """Derivatives of :func:`cosine` with respect to its parameters, of the
+    shape of its values with an extra last axis of length 4."""
+    phase = frequency * (x - t_0)
+    sin = np.sin(phase)
+    return np.stack(
+        [
+            np.cos(phase),
+            -amplitude * (x - t_0) * sin,
+            amplitude * frequency * sin,
+            np.ones_like(phase),
+        ],
+        axis=-1,
+    )
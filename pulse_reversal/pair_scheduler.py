@@ -0,0 +1,161 @@
+"""Parallel execution of experiments on disjoint qubit pairs.
+
+Experiments on pairs that share no qubit and no control channel, such as
+the cross resonance scans of (0, 1) and (2, 3), are played in the same
+pulse sequence. The pairs are grouped by colouring their conflict graph,
+and each group plays its sweep points together.
+
+Example:
+    .. code-block:: python
+
+        sequences = {
+            (CRTL, TGT): cr_sequences(platform, CRTL, TGT, sweep)
+            for CRTL, TGT in pairs
+        }
+        results = execute_pairs(platform, sequences, opts)
+        res1 = [res.magnitude for res in results[(0, 1)][1]]
+"""
+
+from typing import Dict, Hashable, List
+
+from qibolab.execution_parameters import ExecutionParameters
+from qibolab.pulses import PulseSequence, PulseType
+
+PairSequences = Dict[Hashable, List[PulseSequence]]
+"""Map from pairs to their pulse sequences, one per sweep point."""
+
+
+def control_channels(sequences: List[PulseSequence]) -> set:
+    """Channels of the drive and flux pulses of an experiment.
+
+    Readout channels are left out, as multiplexed readout lines measure
+    different qubits at the same time.
+    """
+    return {
+        pulse.channel
+        for sequence in sequences
+        for pulse in sequence
+        if pulse.type is not PulseType.READOUT
+    }
+
+
+def conflict_graph(platform, sequences: PairSequences, neighbours: bool = False):
+    """Graph of pairs that cannot be played in the same sequence.
+
+    Two pairs conflict if they share a qubit or a control channel.
+
+    Args:
+        platform (:class:`platform_with_RY.Platform`): Platform providing the
+            qubit topology.
+        sequences (dict): Sequences of each pair.
+        neighbours (bool): If ``True`` pairs also conflict when one of their
+            qubits is coupled to a qubit of the other in ``platform.topology``,
+            avoiding crosstalk between simultaneous drives.
+    """
+    import networkx as nx
+
+    qubits = {pair: set(pair) for pair in sequences}
+    if neighbours:
+        topology = platform.topology
+        for pair in sequences:
+            qubits[pair] |= {
+                neighbour
+                for qubit in pair
+                if qubit in topology
+                for neighbour in topology[qubit]
+            }
+    channels = {pair: control_channels(seqs) for pair, seqs in sequences.items()}
+
+    graph = nx.Graph()
+    graph.add_nodes_from(sequences)
+    pairs = list(sequences)
+    for i, first in enumerate(pairs):
+        for second in pairs[i + 1 :]:
+            if (
+                qubits[first] & set(second)
+                or qubits[second] & set(first)
+                or channels[first] & channels[second]
+            ):
+                graph.add_edge(first, second)
+    return graph
+
+
+def schedule_pairs(
+    platform, sequences: PairSequences, neighbours: bool = False
+) -> List[List[Hashable]]:
+    """Group pairs that can be played together, with as few groups as the
+    greedy colouring of their :func:`conflict_graph` finds."""
+    import networkx as nx
+
+    graph = conflict_graph(platform, sequences, neighbours)
+    colours = nx.greedy_color(graph, strategy="largest_first")
+    groups = {}
+    # keep the order of the pairs inside each group
+    for pair in sequences:
+        groups.setdefault(colours[pair], []).append(pair)
+    return [groups[colour] for colour in sorted(groups)]
+
+
+def execute_pairs(
+    platform,
+    sequences: PairSequences,
+    options: ExecutionParameters,
+    neighbours: bool = False,
+    **kwargs,
+):
+    """Play the experiments of all pairs, merging the pairs of each group of
+    :func:`schedule_pairs` into one sequence per sweep point.
+
+    Pairs of a group may have different numbers of points, the merged
+    sequences then contain only the pairs with a point left.
+
+    Args:
+        platform (:class:`platform_with_RY.Platform`): Platform executing the
+            merged sequences with
+            :meth:`platform_with_RY.Platform.execute_pulse_sequences`.
+        sequences (dict): Sequences of each pair, one per sweep point.
+        options (:class:`qibolab.platforms.platform.ExecutionParameters`): Object holding the execution options.
+        neighbours (bool): See :func:`conflict_graph`.
+        **kwargs: May need them for something
+    Returns:
+        Dictionary mapping each pair to a dictionary from its readout qubits
+        to the list of results of every point.
+    """
+    groups = schedule_pairs(platform, sequences, neighbours)
+
+    merged = []
+    readouts = {pair: {} for pair in sequences}
+    for group in groups:
+        npoints = max(len(sequences[pair]) for pair in group)
+        for point in range(npoints):
+            sequence = PulseSequence()
+            for pair in group:
+                if point < len(sequences[pair]):
+                    pair_sequence = sequences[pair][point]
+                    sequence.add(*pair_sequence)
+                    for pulse in pair_sequence.ro_pulses:
+                        readouts[pair].setdefault(pulse.qubit, []).append(
+                            (len(merged), pulse.serial)
+                        )
+            merged.append(sequence)
+
+    results = platform.execute_pulse_sequences(merged, options, **kwargs)
+
+    # the results of a serial are in the order of the merged sequences
+    # playing it, which is the order they were appended in
+    occurrences = {}
+    for index, sequence in enumerate(merged):
+        for pulse in sequence.ro_pulses:
+            occurrences.setdefault(pulse.serial, []).append(index)
+    position = {
+        (index, serial): i
+        for serial, indices in occurrences.items()
+        for i, index in enumerate(indices)
+    }
+    return {
+        pair: {
+            qubit: [results[serial][position[index, serial]] for index, serial in keys]
+            for qubit, keys in qubit_readouts.items()
+        }
+        for pair, qubit_readouts in readouts.items()
+    }
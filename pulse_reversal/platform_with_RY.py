@@ -1,33 +1,83 @@
 """A platform for executing quantum algorithms."""
 
-from collections import defaultdict
-from dataclasses import dataclass, field, replace
-from typing import Dict, List, Optional, Tuple
+import copy
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields, replace
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import networkx as nx
+import numpy as np
 from qibo.config import log, raise_error
 
 from qibolab.couplers import Coupler
-from qibolab.execution_parameters import ExecutionParameters
+from qibolab.execution_parameters import AveragingMode, ExecutionParameters
 from qibolab.instruments.abstract import Controller, Instrument, InstrumentId
-from qibolab.pulses import FluxPulse, PulseSequence, ReadoutPulse
+from qibolab.pulses import FluxPulse, PulseSequence, PulseType
 from qibolab.qubits import Qubit, QubitId, QubitPair, QubitPairId
+from qibolab.result import AveragedSampleResults, SampleResults
 from qibolab.sweeper import Sweeper
 
+from adaptive_shots import RunningMean, shot_values
+from result_columns import ResultColumn
+from unrolling import BatchLimits, pack_batches, sequence_costs
+from waveform_cache import CachedShape, WaveformCache, cached_shape
+
+if TYPE_CHECKING:
+    import networkx as nx
+
 InstrumentMap = Dict[InstrumentId, Instrument]
 QubitMap = Dict[QubitId, Qubit]
 CouplerMap = Dict[QubitId, Coupler]
 QubitPairMap = Dict[QubitPairId, QubitPair]
 
 NS_TO_SEC = 1e-9
+RESIDUAL_EXCITATION = 1e-3
+"""Excited population left after the relaxation time, by default."""
+
+
+def minimal_relaxation_time(t1: float, residual: float = RESIDUAL_EXCITATION) -> int:
+    """Time in ns for an excited qubit to decay to the ``residual`` excited
+    population, assuming an exponential decay with time constant ``t1`` ns."""
+    if not 0 < residual < 1:
+        raise_error(ValueError, f"Residual excitation {residual} is not in (0, 1).")
+    return int(np.ceil(t1 * np.log(1 / residual)))
+
+
+def delayed_copy(pulse, delay=0):
+    """Copy of a pulse with its start delayed by ``delay`` ns.
+
+    Unlike :meth:`qibolab.pulses.Pulse.copy` the shape is not rebuilt from
+    its string representation.
+    """
+    new_pulse = copy.copy(pulse)
+    new_pulse.shape = copy.copy(pulse.shape)
+    new_pulse.shape.pulse = new_pulse
+    if delay:
+        new_pulse.start = pulse.start + delay
+    return new_pulse
+
+
+def _place(sequence, start, pulses, readout_map, readouts):
+    """Append delayed copies of the pulses of a sequence, recording its
+    readouts with each serial computed once."""
+    for pulse in sequence:
+        new_pulse = delayed_copy(pulse, start)
+        pulses.append(new_pulse)
+        if pulse.type is PulseType.READOUT:
+            serial, new_serial = pulse.serial, new_pulse.serial
+            readout_map[serial].append(new_serial)
+            readouts.append((serial, pulse.qubit, new_serial))
 
 
 def unroll_sequences(
     sequences: List[PulseSequence], relaxation_time: int
-) -> Tuple[PulseSequence, Dict[str, str]]:
+) -> Tuple[PulseSequence, Dict[str, List[str]], List[Tuple[str, QubitId, str]]]:
     """Unrolls a list of pulse sequences to a single pulse sequence with
     multiple measurements.
 
+    The start of each sequence in the unrolled one is computed up front, so
+    the cost is linear in the total number of pulses.
+
     Args:
         sequences (list): List of pulse sequences to unroll.
         relaxation_time (int): Time in ns to wait for the qubit to relax between
@@ -38,19 +88,90 @@ def unroll_sequences(
             multiple measurements.
         readout_map (dict): Map from original readout pulse serials to the unrolled readout pulse
             serials. Required to construct the results dictionary that is returned after execution.
+        readouts (list): Original serial, qubit and unrolled serial of every
+            readout, in sequence order, see :func:`collect_readouts`.
+    """
+    finishes = np.array([sequence.finish for sequence in sequences])
+    starts = np.cumsum(finishes + relaxation_time) - finishes - relaxation_time
+
+    pulses = []
+    readout_map = defaultdict(list)
+    readouts = []
+    for sequence, start in zip(sequences, starts.tolist()):
+        _place(sequence, start, pulses, readout_map, readouts)
+    # pulses are already ordered, sorting them once is linear
+    return PulseSequence(*pulses), readout_map, readouts
+
+
+def interleave_sequences(
+    sequences: List[PulseSequence], relaxation_time: int
+) -> Tuple[PulseSequence, Dict[str, List[str]], List[Tuple[str, QubitId, str]]]:
+    """Unrolls a list of pulse sequences letting sequences on different qubits
+    overlap, so that a qubit is measured while another one relaxes.
+
+    Each sequence starts as soon as the qubits and drive or flux channels it
+    uses have relaxed for ``relaxation_time`` after their previous sequence,
+    and its readout channels are free. Sequences sharing any of them keep
+    their order.
+
+    Args:
+        sequences (list): List of pulse sequences to unroll.
+        relaxation_time (int): Time in ns to wait for each qubit to relax
+            between the sequences it takes part in.
+
+    Returns:
+        Same as :func:`unroll_sequences`.
     """
-    total_sequence = PulseSequence()
+    # time at which each qubit and channel is available
+    free = defaultdict(float)
+
+    pulses = []
     readout_map = defaultdict(list)
-    start = 0
+    readouts = []
     for sequence in sequences:
-        for pulse in sequence:
-            new_pulse = pulse.copy()
-            new_pulse.start += start
-            total_sequence.add(new_pulse)
-            if isinstance(pulse, ReadoutPulse):
-                readout_map[pulse.serial].append(new_pulse.serial)
-        start = total_sequence.finish + relaxation_time
-    return total_sequence, readout_map
+        relaxing = {("qubit", pulse.qubit) for pulse in sequence}
+        relaxing |= {
+            ("channel", pulse.channel)
+            for pulse in sequence
+            if pulse.type is not PulseType.READOUT
+        }
+        busy = {("channel", pulse.channel) for pulse in sequence.ro_pulses}
+        start = max(free[resource] for resource in relaxing | busy)
+        finish = start + sequence.finish
+        for resource in busy:
+            free[resource] = finish
+        for resource in relaxing:
+            free[resource] = finish + relaxation_time
+        _place(sequence, start, pulses, readout_map, readouts)
+    return PulseSequence(*pulses), readout_map, readouts
+
+
+def collect_readouts(results, result, readouts):
+    """Append the results of an unrolled sequence to the results of the
+    original readouts and of their qubits.
+
+    Args:
+        results (dict): Lists of results by original readout serial and qubit.
+        result (dict): Results of the unrolled sequence, by readout serial.
+        readouts (list): Readouts returned by :func:`unroll_sequences`.
+    """
+    for serial, qubit, new_serial in readouts:
+        value = result[new_serial]
+        results[serial].append(value)
+        results[qubit].append(value)
+
+
+def _checkpoint_value(result):
+    """Values of a result stored by checkpointed sweeps.
+
+    Averaged discriminated results have no samples, so their statistical
+    frequency is stored instead.
+    """
+    if isinstance(result, AveragedSampleResults):
+        return result.statistical_frequency
+    if isinstance(result, SampleResults):
+        return result.samples
+    return result.magnitude
 
 
 @dataclass
@@ -62,6 +183,14 @@ class Settings:
     relaxation_time: int = int(1e5)
     """Time in ns to wait for the qubit to relax to its ground state between
     shots."""
+    relaxation_times: Dict[QubitId, int] = field(default_factory=dict)
+    """Relaxation time in ns of each qubit, set by the T1 tuner.
+
+    Used instead of :attr:`relaxation_time` when all executed qubits have one,
+    see :meth:`Platform.fill_options`.
+    """
+    residual_excitation: float = RESIDUAL_EXCITATION
+    """Excited population allowed after the relaxation time of a qubit."""
 
     def fill(self, options: ExecutionParameters):
         """Use default values for missing execution options."""
@@ -105,18 +234,60 @@ class Platform:
     is_connected: bool = False
     """Flag for whether we are connected to the physical instruments."""
 
-    topology: nx.Graph = field(default_factory=nx.Graph)
-    """Graph representing the qubit connectivity in the quantum chip."""
+    _topology: Optional["nx.Graph"] = field(default=None, init=False, repr=False)
+    """Connectivity graph, built on first access of :attr:`topology`."""
+
+    batch_limits: Dict[InstrumentId, BatchLimits] = field(default_factory=dict)
+    """Resources of each controller available to a single unrolled sequence.
+
+    Controllers without limits use the batches of their driver.
+    """
+
+    waveform_cache: Optional[WaveformCache] = field(default_factory=WaveformCache)
+    """Envelopes shared by the pulses created by the platform.
+
+    Set to ``None`` to let every pulse compute its own waveforms.
+    """
+
+    linked_duration_sweeps: bool = False
+    """Whether the controllers delay the pulses following a pulse whose
+    duration is swept, so that duration loops moving the later pulses can run
+    as native sweeps."""
+
+    reset_latency: Optional[float] = None
+    """Time in ns the controllers take to play a pulse conditioned on a
+    measurement, used by active reset.
+
+    ``None`` if the controllers have no feedback, in which case active reset
+    falls back to the relaxation time given by the qubit T1.
+    """
+
+    warn_repeated_execution: bool = False
+    """Warn when the same sequence is executed twice in a row without
+    changes, which is usually a second execution only to read another
+    readout pulse of the sequence."""
+    _last_sequence: Optional[int] = field(default=None, init=False, repr=False)
+    """Hash of the last sequence passed to
+    :meth:`qibolab.platform.Platform.execute_pulse_sequence`."""
 
     def __post_init__(self):
         log.info("Loading platform %s", self.name)
         if self.resonator_type is None:
             self.resonator_type = "3D" if self.nqubits == 1 else "2D"
 
-        self.topology.add_nodes_from(self.qubits.keys())
-        self.topology.add_edges_from(
-            [(pair.qubit1.name, pair.qubit2.name) for pair in self.pairs.values()]
-        )
+    @property
+    def topology(self) -> "nx.Graph":
+        """Graph representing the qubit connectivity in the quantum chip."""
+        if self._topology is None:
+            # networkx is slow to import and most experiments never need it
+            import networkx as nx
+
+            self._topology = nx.Graph()
+            self._topology.add_nodes_from(self.qubits.keys())
+            self._topology.add_edges_from(
+                [(pair.qubit1.name, pair.qubit2.name) for pair in self.pairs.values()]
+            )
+        return self._topology
 
     def __str__(self):
         return self.name
@@ -174,54 +345,257 @@ class Platform:
 
         return result
 
+    @property
+    def residual_excitation(self) -> float:
+        """Excited population allowed after relaxation, from the settings.
+
+        Settings loaded by :func:`qibolab.serialize.load_settings` do not
+        have it, they use :data:`RESIDUAL_EXCITATION`.
+        """
+        return getattr(self.settings, "residual_excitation", RESIDUAL_EXCITATION)
+
+    def fill_options(self, options: ExecutionParameters, qubits):
+        """Use default values for missing execution options.
+
+        A missing relaxation time is the longest of the relaxation times tuned
+        for the executed qubits, if all of them have one, see
+        :attr:`Settings.relaxation_times`, and the default one otherwise.
+
+        Args:
+            options (:class:`qibolab.platforms.platform.ExecutionParameters`): Execution options.
+            qubits: Names of the executed qubits.
+        """
+        relaxation_times = getattr(self.settings, "relaxation_times", {})
+        qubits = set(qubits)
+        if (
+            options.relaxation_time is None
+            and qubits
+            and qubits <= relaxation_times.keys()
+        ):
+            relaxation_time = max(relaxation_times[qubit] for qubit in qubits)
+            options = replace(options, relaxation_time=relaxation_time)
+        return self.settings.fill(options)
+
+    def create_reset_pulses(self, qubit, start=0):
+        """Measurement and pi pulse returning the qubit to its ground state
+        when the measurement finds it excited."""
+        measurement = self.create_MZ_pulse(qubit, start)
+        latency = self.reset_latency or 0
+        pi_pulse = self.create_RX_pulse(qubit, start=measurement.finish + latency)
+        return measurement, pi_pulse
+
+    def reset_options(self, options: ExecutionParameters, qubits):
+        """Replace the passive relaxation by active reset of the qubits, if
+        ``options.fast_reset`` is set.
+
+        With feedback, each shot waits only for the measurement and
+        conditioned pi pulse of :meth:`create_reset_pulses`. Without it, fast
+        reset is disabled and the relaxation time is the shortest letting every
+        qubit decay, see :func:`minimal_relaxation_time`.
+
+        Args:
+            options (:class:`qibolab.platforms.platform.ExecutionParameters`): Execution options.
+            qubits: Names of the qubits played by the executed sequences.
+        """
+        if not options.fast_reset:
+            return options
+        if options.fast_reset is not True:
+            qubits = options.fast_reset
+        qubits = [qubit for qubit in qubits if qubit in self.qubits]
+
+        if self.reset_latency is not None:
+            relaxation_time = max(
+                (self.create_reset_pulses(qubit)[1].finish for qubit in qubits),
+                default=0,
+            )
+            return replace(options, relaxation_time=int(np.ceil(relaxation_time)))
+
+        unknown = [qubit for qubit in qubits if not self.qubits[qubit].T1]
+        if unknown:
+            log.warning(
+                f"Active reset is not available and T1 of qubits {unknown} is "
+                f"unknown, keeping the relaxation time {options.relaxation_time}."
+            )
+            return replace(options, fast_reset=False)
+        relaxation_time = max(
+            (
+                minimal_relaxation_time(self.qubits[qubit].T1, self.residual_excitation)
+                for qubit in qubits
+            ),
+            default=0,
+        )
+        log.info(
+            "Active reset is not available, relaxing for "
+            f"{relaxation_time} ns according to T1."
+        )
+        return replace(options, fast_reset=False, relaxation_time=relaxation_time)
+
     def execute_pulse_sequence(
-        self, sequence: PulseSequence, options: ExecutionParameters, **kwargs
+        self,
+        sequence: PulseSequence,
+        options: ExecutionParameters,
+        target_error: Optional[float] = None,
+        chunk_shots: int = 100,
+        **kwargs,
     ):
         """
         Args:
             sequence (:class:`qibolab.pulses.PulseSequence`): Pulse sequences to execute.
             options (:class:`qibolab.platforms.platform.ExecutionParameters`): Object holding the execution options.
+            target_error (float): If given, shots are acquired in chunks of
+                ``chunk_shots`` single shots until the standard error of every
+                readout is below ``target_error``, or ``options.nshots`` shots
+                are reached. Averaged results are returned.
+            chunk_shots (int): Number of shots of each chunk.
             **kwargs: May need them for something
         Returns:
             Readout results acquired by after execution.
         """
-        options = self.settings.fill(options)
+        options = self.fill_options(options, sequence.qubits)
+        options = self.reset_options(options, sequence.qubits)
 
         time = (
             (sequence.duration + options.relaxation_time) * options.nshots * NS_TO_SEC
         )
         log.info(f"Minimal execution time (sequence): {time}")
 
+        if self.warn_repeated_execution:
+            sequence_hash = hash(sequence)
+            if sequence_hash == self._last_sequence:
+                log.warning(
+                    "Executing the same sequence twice in a row. "
+                    "All readout pulses are returned by a single execution."
+                )
+            self._last_sequence = sequence_hash
+
+        if target_error is not None:
+            return self._execute_adaptive(
+                sequence, options, target_error, chunk_shots, **kwargs
+            )
         return self._execute(sequence, options, **kwargs)
 
+    def _execute_adaptive(self, sequence, options, target_error, chunk_shots, **kwargs):
+        """Execute single shot chunks until every readout converged."""
+        accumulators = {pulse.serial: RunningMean() for pulse in sequence.ro_pulses}
+        shots = 0
+        while shots < options.nshots:
+            chunk = replace(
+                options,
+                nshots=min(chunk_shots, options.nshots - shots),
+                averaging_mode=AveragingMode.SINGLESHOT,
+            )
+            result = self._execute(sequence, chunk, **kwargs)
+            for serial, accumulator in accumulators.items():
+                accumulator.update(shot_values(result[serial]))
+            shots += chunk.nshots
+            if all(acc.error <= target_error for acc in accumulators.values()):
+                break
+        log.info(f"Adaptive execution stopped after {shots}/{options.nshots} shots.")
+
+        results = {}
+        for pulse in sequence.ro_pulses:
+            results[pulse.serial] = accumulators[pulse.serial].result()
+            results[pulse.qubit] = results[pulse.serial]
+        return results
+
     @property
-    def _controller(self):
-        """Controller instrument used for splitting the unrolled sequences to
-        batches.
+    def _controllers(self):
+        """Controller instruments of the platform."""
+        return {
+            name: instr
+            for name, instr in self.instruments.items()
+            if isinstance(instr, Controller)
+        }
 
-        Used only by :meth:`qibolab.platform.Platform.execute_pulse_sequences` (unrolling).
-        This method does not support platforms with more than one controller instruments.
+    @property
+    def channel_owners(self) -> Dict[str, InstrumentId]:
+        """Map from channel names to the controller playing them."""
+        ports = {
+            id(port): name
+            for name, controller in self._controllers.items()
+            for port in controller._ports.values()
+        }
+        owners = {}
+        for element in list(self.qubits.values()) + list(self.couplers.values()):
+            for channel in element.channels:
+                if id(channel.port) in ports:
+                    owners[channel.name] = ports[id(channel.port)]
+        return owners
+
+    def split_batches(self, sequences: List[PulseSequence], relaxation_time: int):
+        """Split sequences to the fewest batches that every controller can play
+        as a single unrolled sequence.
+
+        Pulses are charged only to the controller owning their channel, so
+        platforms with more than one controller are supported. Controllers
+        without :attr:`batch_limits` keep the batches of their driver's
+        ``split_batches``, and are unbounded only if the driver does not
+        implement it.
         """
-        controllers = [
-            instr
-            for instr in self.instruments.values()
-            if isinstance(instr, Controller)
-        ]
-        assert len(controllers) == 1
-        return controllers[0]
+        controllers = self._controllers
+        sequences = list(sequences)
+        # batches never cross the boundaries of the drivers' own batches
+        boundaries = {len(sequences)}
+        for name, controller in controllers.items():
+            if name in self.batch_limits:
+                continue
+            try:
+                batches = controller.split_batches(sequences)
+            except RuntimeError:
+                continue
+            boundaries.update(np.cumsum([len(batch) for batch in batches]).tolist())
+
+        costs = sequence_costs(
+            sequences,
+            self.channel_owners,
+            {name: controllers[name].sampling_rate for name in controllers},
+            relaxation_time,
+        )
+        limits = np.array(
+            [self.batch_limits.get(name, BatchLimits()).array for name in controllers]
+        )
+        start = 0
+        for stop in sorted(boundaries):
+            yield from pack_batches(sequences[start:stop], costs[start:stop], limits)
+            start = stop
+
+    def _unroll_batch(self, batch, relaxation_time, interleave=False):
+        """Unroll a batch and compute the envelopes it will play."""
+        unroll = interleave_sequences if interleave else unroll_sequences
+        sequence, _, readouts = unroll(batch, relaxation_time)
+        if self.waveform_cache is not None:
+            # pulses differing only in start share the same samples
+            sampling_rate = self.sampling_rate
+            for pulse in sequence:
+                if not isinstance(pulse.shape, CachedShape):
+                    pulse.shape = cached_shape(pulse.shape, self.waveform_cache)
+                pulse.envelope_waveforms(sampling_rate)
+        return sequence, readouts
 
     def execute_pulse_sequences(
-        self, sequences: List[PulseSequence], options: ExecutionParameters, **kwargs
+        self,
+        sequences: List[PulseSequence],
+        options: ExecutionParameters,
+        interleave: bool = False,
+        **kwargs,
     ):
         """
         Args:
             sequence (List[:class:`qibolab.pulses.PulseSequence`]): Pulse sequences to execute.
             options (:class:`qibolab.platforms.platform.ExecutionParameters`): Object holding the execution options.
+            interleave (bool): If ``True`` the relaxation time is enforced per
+                qubit, and sequences on disjoint qubits are played while the
+                others relax, see :func:`interleave_sequences`.
             **kwargs: May need them for something
         Returns:
-            Readout results acquired by after execution.
+            Dictionary mapping readout serials to
+            :class:`result_columns.ResultColumn` objects, holding the results
+            of every sequence playing the readout, and qubits to the results
+            of all their readouts in sequence order.
         """
-        options = self.settings.fill(options)
+        qubits = {qubit for sequence in sequences for qubit in sequence.qubits}
+        options = self.fill_options(options, qubits)
+        options = self.reset_options(options, qubits)
 
         duration = sum(seq.duration for seq in sequences)
         time = (
@@ -231,25 +605,167 @@ class Platform:
         )
         log.info(f"Minimal execution time (unrolling): {time}")
 
-        # find readout pulses
-        ro_pulses = {
-            pulse.serial: pulse.qubit
+        # the number of readouts is known, results are written in place
+        rows = Counter(
+            key
             for sequence in sequences
             for pulse in sequence.ro_pulses
-        }
+            for key in (pulse.serial, pulse.qubit)
+        )
+        results = {key: ResultColumn(capacity) for key, capacity in rows.items()}
 
-        results = defaultdict(list)
-        for batch in self._controller.split_batches(sequences):
-            sequence, readouts = unroll_sequences(batch, options.relaxation_time)
-            result = self._execute(sequence, options, **kwargs)
-            for serial, new_serials in readouts.items():
-                results[serial].extend(result[ser] for ser in new_serials)
+        batches = iter(self.split_batches(sequences, options.relaxation_time))
+
+        def unroll_next(pool):
+            batch = next(batches, None)
+            if batch is None:
+                return None
+            return pool.submit(
+                self._unroll_batch, batch, options.relaxation_time, interleave
+            )
 
-        for serial, qubit in ro_pulses.items():
-            results[qubit] = results[serial]
+        # the next batch is unrolled while the current one is playing
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            unrolled = unroll_next(pool)
+            while unrolled is not None:
+                sequence, readouts = unrolled.result()
+                unrolled = unroll_next(pool)
+                result = self._execute(sequence, options, **kwargs)
+                collect_readouts(results, result, readouts)
 
         return results
 
+    def execute_sweep(
+        self,
+        plan,
+        options: ExecutionParameters,
+        native: bool = True,
+        checkpoint=None,
+        name: Optional[str] = None,
+        restart: bool = False,
+        **kwargs,
+    ):
+        """Executes all points of a sweep plan with the minimal number of
+        calls to the instruments.
+
+        Plans that only change pulse parameters the controllers can sweep are
+        played with a single :meth:`qibolab.platform.Platform.sweep`, see
+        :meth:`native_sweepers`. The rest are materialized and
+        played in unrolled batches with
+        :meth:`qibolab.platform.Platform.execute_pulse_sequences`.
+
+        Args:
+            plan (:class:`sweep_plan.SweepPlan`): Template sequence and parameter axes.
+            options (:class:`qibolab.platforms.platform.ExecutionParameters`): Object holding the execution options.
+            native (bool): If ``False`` always unroll, even if the plan could be swept natively.
+            checkpoint (:class:`result_store.SweepCheckpoint`): If given, the
+                points are unrolled and their magnitudes, or the samples or
+                statistical frequencies of discriminated results, stored after
+                every batch. Points already stored under ``name`` are skipped.
+            name (str): Name of the sweep in the checkpoint.
+            restart (bool): If ``True`` the points stored under ``name`` for a
+                different plan or options are discarded, otherwise resuming
+                them raises an error.
+            **kwargs: May need them for something
+        Returns:
+            Dictionary mapping the template readout serials, and their qubits, to
+            the list of results of every sweep point, or to the array of their
+            stored values when a checkpoint is given.
+        """
+        options = self.fill_options(options, plan.sequence.qubits)
+
+        if checkpoint is not None:
+            if name is None:
+                raise_error(ValueError, "Checkpointed sweeps need a name.")
+            results = self._execute_resumable(
+                plan, options, checkpoint, name, restart, **kwargs
+            )
+            for pulse in plan.sequence.ro_pulses:
+                results[pulse.qubit] = results[pulse.serial]
+            return results
+
+        sweepers = self.native_sweepers(plan) if native else None
+        if sweepers is not None:
+            results = plan.split(self.sweep(plan.sequence, options, *sweepers))
+        else:
+            sequences, readouts = plan.sequences()
+            results = plan.collect(
+                self.execute_pulse_sequences(sequences, options, **kwargs), readouts
+            )
+
+        for pulse in plan.sequence.ro_pulses:
+            results[pulse.qubit] = results[pulse.serial]
+
+        return results
+
+    def can_sweep(self, parameter, pulses) -> bool:
+        """Whether the controllers playing the pulses sweep the parameter.
+
+        Controllers without ``available_sweep_parameters`` are assumed to
+        sweep every parameter.
+        """
+        owners = self.channel_owners
+        controllers = self._controllers
+        names = {owners.get(pulse.channel) for pulse in pulses}
+        if None in names:
+            names = controllers.keys()
+        return all(
+            parameter
+            in getattr(controllers[name], "available_sweep_parameters", {parameter})
+            for name in names
+        )
+
+    def native_sweepers(self, plan) -> Optional[List[Sweeper]]:
+        """Sweepers executing a plan with :meth:`sweep`, or ``None`` if it has
+        to be unrolled."""
+        if self.linked_duration_sweeps:
+            sweepers = plan.linked_sweepers
+        else:
+            sweepers = plan.sweepers
+        if sweepers is None:
+            return None
+        for sweeper in sweepers:
+            if not self.can_sweep(sweeper.parameter, sweeper.pulses):
+                log.info(
+                    f"Controllers cannot sweep {sweeper.parameter.name}, unrolling."
+                )
+                return None
+        return sweepers
+
+    def _execute_resumable(self, plan, options, checkpoint, name, restart, **kwargs):
+        """Play the points of a plan missing from a checkpoint, batch by batch."""
+        sequences, readouts = plan.sequences()
+        description = {
+            "shape": list(plan.shape),
+            "options": {
+                option.name: str(getattr(options, option.name))
+                for option in fields(options)
+            },
+        }
+        checkpoint.check(name, len(plan), list(readouts), description, restart)
+        start = checkpoint.done(name)
+        if start == len(sequences):
+            log.info(f"Sweep {name} already complete, loading its results.")
+        elif start > 0:
+            log.info(f"Resuming sweep {name} after {start}/{len(sequences)} points.")
+
+        for batch in self.split_batches(sequences[start:], options.relaxation_time):
+            stop = start + len(batch)
+            batch_readouts = {
+                serial: serials[start:stop] for serial, serials in readouts.items()
+            }
+            results = plan.collect(
+                self.execute_pulse_sequences(batch, options, **kwargs), batch_readouts
+            )
+            values = {
+                serial: [_checkpoint_value(result) for result in point_results]
+                for serial, point_results in results.items()
+            }
+            checkpoint.record(name, len(sequences), values, description)
+            start = stop
+
+        return checkpoint.load(name)
+
     def sweep(
         self, sequence: PulseSequence, options: ExecutionParameters, *sweepers: Sweeper
     ):
@@ -280,11 +796,8 @@ class Platform:
         Returns:
             Readout results acquired by after execution.
         """
-        if options.nshots is None:
-            options = replace(options, nshots=self.settings.nshots)
-
-        if options.relaxation_time is None:
-            options = replace(options, relaxation_time=self.settings.relaxation_time)
+        options = self.fill_options(options, sequence.qubits)
+        options = self.reset_options(options, sequence.qubits)
 
         time = (
             (sequence.duration + options.relaxation_time) * options.nshots * NS_TO_SEC
@@ -306,6 +819,12 @@ class Platform:
     def __call__(self, sequence, options):
         return self.execute_pulse_sequence(sequence, options)
 
+    def _cached(self, pulse):
+        """Share the envelopes of a new pulse through the waveform cache."""
+        if self.waveform_cache is not None:
+            pulse.shape = cached_shape(pulse.shape, self.waveform_cache)
+        return pulse
+
     def get_qubit(self, qubit):
         """Return the name of the physical qubit corresponding to a logical
         qubit.
@@ -332,15 +851,21 @@ class Platform:
 
     def create_RX90_pulse(self, qubit, start=0, relative_phase=0):
         qubit = self.get_qubit(qubit)
-        return self.qubits[qubit].native_gates.RX90.pulse(start, relative_phase)
+        return self._cached(
+            self.qubits[qubit].native_gates.RX90.pulse(start, relative_phase)
+        )
 
     def create_RX_pulse(self, qubit, start=0, relative_phase=0):
         qubit = self.get_qubit(qubit)
-        return self.qubits[qubit].native_gates.RX.pulse(start, relative_phase)
+        return self._cached(
+            self.qubits[qubit].native_gates.RX.pulse(start, relative_phase)
+        )
 
     def create_RX12_pulse(self, qubit, start=0, relative_phase=0):
         qubit = self.get_qubit(qubit)
-        return self.qubits[qubit].native_gates.RX12.pulse(start, relative_phase)
+        return self._cached(
+            self.qubits[qubit].native_gates.RX12.pulse(start, relative_phase)
+        )
 
     def create_CZ_pulse_sequence(self, qubits, start=0):
         pair = tuple(self.get_qubit(q) for q in qubits)
@@ -371,19 +896,19 @@ class Platform:
 
     def create_MZ_pulse(self, qubit, start):
         qubit = self.get_qubit(qubit)
-        return self.qubits[qubit].native_gates.MZ.pulse(start)
+        return self._cached(self.qubits[qubit].native_gates.MZ.pulse(start))
 
     def create_qubit_drive_pulse(self, qubit, start, duration, relative_phase=0):
         qubit = self.get_qubit(qubit)
         pulse = self.qubits[qubit].native_gates.RX.pulse(start, relative_phase)
         pulse.duration = duration
-        return pulse
+        return self._cached(pulse)
     
     def create_qubit_Y_drive_pulse(self, qubit, start, duration, relative_phase=0):
         qubit = self.get_qubit(qubit)
         pulse = self.qubits[qubit].native_gates.RY.pulse(start, relative_phase)
         pulse.duration = duration
-        return pulse
+        return self._cached(pulse)
 
     def create_qubit_readout_pulse(self, qubit, start):
         qubit = self.get_qubit(qubit)
@@ -400,7 +925,7 @@ class Platform:
             qubit=qubit,
         )
         pulse.duration = duration
-        return pulse
+        return self._cached(pulse)
 
     def create_coupler_pulse(self, coupler, start, duration=None, amplitude=None):
         coupler = self.get_coupler(coupler)
@@ -409,7 +934,7 @@ class Platform:
             pulse.duration = duration
         if amplitude is not None:
             pulse.amplitude = amplitude
-        return pulse
+        return self._cached(pulse)
 
     # TODO Remove RX90_drag_pulse and RX_drag_pulse, replace them with create_qubit_drive_pulse
     # TODO Add RY90 and RY pulses
@@ -1,10 +1,13 @@
+import hashlib
+import importlib
 import importlib.metadata as im
 import importlib.util
 import os
+import pickle
 from pathlib import Path
 
 from qibo import Circuit
-from qibo.config import raise_error
+from qibo.config import log, raise_error
 
 from qibolab.execution_parameters import (
     AcquisitionType,
@@ -15,9 +18,16 @@ from qibolab.execution_parameters import (
 from platform_with_RY import Platform
 from qibolab.serialize import PLATFORM
 
-__version__ = im.version(__package__)
+__version__ = im.version("qibolab")
 
 PLATFORMS = "QIBOLAB_PLATFORMS"
+PLATFORMS_CACHE = "QIBOLAB_PLATFORMS_CACHE"
+SNAPSHOT_MODULES = ("platform_with_RY", "unrolling", "waveform_cache")
+"""Modules defining the classes of cached platforms.
+
+Unpickling skips the dataclass defaults, so snapshots of a platform built
+with an older version of these modules would miss their new fields.
+"""
 
 
 def get_platforms_path():
@@ -31,14 +41,87 @@ def get_platforms_path():
     return Path(profiles)
 
 
-def create_platform(name, path: Path = None) -> Platform:
+def get_cache_path():
+    """Get path to the directory of cached platforms.
+
+    Path is specified using the environment variable QIBOLAB_PLATFORMS_CACHE,
+    by default ``~/.cache/qibolab_platforms``.
+    """
+    cache = os.environ.get(PLATFORMS_CACHE)
+    if cache is None:
+        return Path.home() / ".cache" / "qibolab_platforms"
+    return Path(cache)
+
+
+def platform_digest(platform: Path, path: Path = None) -> str:
+    """Hash of the files defining a platform, of the modules in
+    :data:`SNAPSHOT_MODULES` and of the qibolab version."""
+    digest = hashlib.sha1(im.version("qibolab").encode())
+    files = [
+        file
+        for file in sorted(platform.rglob("*"))
+        if file.is_file() and "__pycache__" not in file.parts
+    ]
+    if path is not None:
+        files.append(Path(path))
+    files += [
+        Path(importlib.import_module(module).__file__) for module in SNAPSHOT_MODULES
+    ]
+    for file in files:
+        digest.update(str(file).encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def _load_snapshot(snapshot: Path):
+    try:
+        with open(snapshot, "rb") as file:
+            return pickle.load(file)
+    except Exception as exception:
+        log.warning(f"Cannot load cached platform {snapshot}: {exception}")
+        return None
+
+
+def _snapshot_path(name, path: Path, digest: str) -> Path:
+    """Snapshot file of a platform, named after the platform, the runcard
+    ``path`` it was loaded from and the digest of its files."""
+    if path is None:
+        runcard = "default"
+    else:
+        runcard = hashlib.sha1(str(path).encode()).hexdigest()[:12]
+    return get_cache_path() / f"{name}-{runcard}-{digest}.pkl"
+
+
+def _save_snapshot(snapshot: Path, platform):
+    try:
+        data = pickle.dumps(platform, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as exception:
+        log.warning(f"Platform {platform} cannot be cached: {exception}")
+        return
+    snapshot.parent.mkdir(parents=True, exist_ok=True)
+    # only older snapshots of the same platform and runcard path are stale
+    prefix = snapshot.name.rsplit("-", 1)[0]
+    for stale in snapshot.parent.glob(f"{prefix}-*.pkl"):
+        stale.unlink(missing_ok=True)
+    # replacing the file is atomic, concurrent jobs never read a partial snapshot
+    tmp = snapshot.with_name(f"{snapshot.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, snapshot)
+
+
+def create_platform(name, path: Path = None, cache: bool = True) -> Platform:
     """A platform for executing quantum algorithms.
 
     It consists of a quantum processor QPU and a set of controlling instruments.
 
+    The constructed platform is pickled in the cache directory, see
+    :func:`get_cache_path`, and later calls load it instead of executing the
+    platform module again, until a file of the platform changes.
+
     Args:
         name (str): name of the platform. Options are 'tiiq', 'qili' and 'icarusq'.
         path (pathlib.Path): path with platform serialization
+        cache (bool): If ``False`` always construct the platform from its files.
     Returns:
         The plaform class.
     """
@@ -51,13 +134,24 @@ def create_platform(name, path: Path = None) -> Platform:
     if not platform.exists():
         raise_error(ValueError, f"Platform {name} does not exist.")
 
+    if cache:
+        snapshot = _snapshot_path(name, path, platform_digest(platform, path))
+        if snapshot.exists():
+            created = _load_snapshot(snapshot)
+            if created is not None:
+                return created
+
     spec = importlib.util.spec_from_file_location("platform", platform / PLATFORM)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
 
     if path is None:
-        return module.create()
-    return module.create(path)
+        created = module.create()
+    else:
+        created = module.create(path)
+    if cache:
+        _save_snapshot(snapshot, created)
+    return created
 
 
 def execute_qasm(circuit: str, platform, runcard=None, initial_state=None, nshots=1000):
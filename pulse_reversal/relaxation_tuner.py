@@ -0,0 +1,143 @@
+"""Relaxation times tuned from the T1 measured on each qubit.
+
+Example:
+    .. code-block:: python
+
+        delays = np.linspace(0, 100e3, 41)
+        tune_relaxation(platform, [1, 2], delays, opts, residual=1e-3)
+        # uses the tuned relaxation of the executed qubits
+        opts = replace(opts, relaxation_time=None)
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+from qibo.config import log
+
+from qibolab.execution_parameters import ExecutionParameters
+from qibolab.pulses import PulseSequence
+
+from platform_with_RY import minimal_relaxation_time
+from sweep_plan import SweepPlan
+
+
+def decay(t, amplitude, t1, offset):
+    return amplitude * np.exp(-t / t1) + offset
+
+
+def fit_t1(delays, magnitudes) -> float:
+    """T1 in ns of an exponential decay of the readout magnitude.
+
+    Raises:
+        RuntimeError: If the fit fails or its parameters are undetermined.
+    """
+    from scipy.optimize import curve_fit
+
+    delays = np.asarray(delays, dtype=float)
+    magnitudes = np.asarray(magnitudes, dtype=float)
+    amplitude = magnitudes[0] - magnitudes[-1]
+    # time at which the signal crossed 1/e of its initial excess
+    decayed = np.abs(magnitudes - magnitudes[-1]) < np.abs(amplitude) / np.e
+    t1 = delays[np.argmax(decayed)] if decayed.any() else delays[-1]
+    params, covariance = curve_fit(
+        decay,
+        delays,
+        magnitudes,
+        p0=[amplitude, max(t1, delays[1]), magnitudes[-1]],
+        bounds=([-np.inf, 0, -np.inf], np.inf),
+    )
+    if not np.isfinite(covariance).all():
+        raise RuntimeError("Covariance of the parameters could not be estimated.")
+    return params[1]
+
+
+def measure_t1(
+    platform, qubits: List, delays, options: ExecutionParameters
+) -> Dict[object, float]:
+    """Measure T1 of the qubits with a single batched idle-delay sweep.
+
+    Each delay is one sequence exciting all the qubits and reading them out
+    after the delay.
+
+    Returns:
+        Dictionary mapping the qubits to their T1 in ns, leaving out those
+        whose decay could not be fitted or is longer than the delays.
+    """
+    sequences = []
+    readout_map = {qubit: [] for qubit in qubits}
+    for delay in delays:
+        sequence = PulseSequence()
+        for qubit in qubits:
+            pi_pulse = platform.create_RX_pulse(qubit, start=0)
+            ro_pulse = platform.create_MZ_pulse(qubit, start=pi_pulse.finish + delay)
+            sequence.add(pi_pulse, ro_pulse)
+            readout_map[qubit].append(ro_pulse.serial)
+        sequences.append(sequence)
+
+    results = SweepPlan.collect(
+        platform.execute_pulse_sequences(sequences, options), readout_map
+    )
+
+    t1s = {}
+    for qubit, qubit_results in results.items():
+        magnitudes = [result.magnitude for result in qubit_results]
+        try:
+            t1 = fit_t1(delays, magnitudes)
+        except RuntimeError as exception:
+            log.warning(f"Cannot fit the T1 of qubit {qubit}: {exception}")
+            continue
+        if t1 > np.max(delays):
+            log.warning(
+                f"T1 of qubit {qubit} ({t1:.0f} ns) is longer than the delays, "
+                "extend them to tune its relaxation time."
+            )
+            continue
+        t1s[qubit] = t1
+    return t1s
+
+
+def tune_relaxation(
+    platform,
+    qubits: List,
+    delays,
+    options: ExecutionParameters,
+    residual: Optional[float] = None,
+) -> Dict[object, int]:
+    """Measure T1 and store the relaxation time of each qubit in the platform
+    settings.
+
+    Args:
+        platform (:class:`platform_with_RY.Platform`): Platform to tune.
+        qubits (list): Qubits to measure.
+        delays: Idle times in ns between excitation and readout.
+        options (:class:`qibolab.platforms.platform.ExecutionParameters`): Options
+            of the T1 measurement, with a relaxation time long enough for the
+            untuned qubits.
+        residual (float): Excited population allowed after relaxation, stored
+            as ``platform.settings.residual_excitation``. By default the
+            current one.
+
+    Qubits whose T1 cannot be measured keep their current relaxation time.
+
+    Returns:
+        Dictionary mapping the qubits to their new relaxation time in ns.
+    """
+    settings = platform.settings
+    if residual is not None:
+        settings.residual_excitation = residual
+
+    relaxation_times = {}
+    for qubit, t1 in measure_t1(platform, qubits, delays, options).items():
+        platform.qubits[qubit].T1 = int(round(t1))
+        relaxation_times[qubit] = minimal_relaxation_time(
+            t1, platform.residual_excitation
+        )
+        log.info(
+            f"Qubit {qubit}: T1 = {t1:.0f} ns, relaxation time "
+            f"{relaxation_times[qubit]} ns."
+        )
+    # settings loaded by qibolab have no relaxation times
+    if not hasattr(settings, "relaxation_times"):
+        settings.relaxation_times = {}
+    settings.relaxation_times.update(relaxation_times)
+    return relaxation_times
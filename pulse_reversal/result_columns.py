@@ -0,0 +1,141 @@
+"""Columnar storage of the results of many readouts."""
+
+from collections.abc import Sequence
+from functools import cached_property
+from typing import Optional
+
+import numpy as np
+from qibo.config import raise_error
+
+
+class ResultColumn(Sequence):
+    """Results of the successive executions of a readout pulse, with the I
+    and Q of all of them in a single float32 array.
+
+    Indexing returns a result object of the type given by the controller,
+    so code written for lists of results keeps working, while the
+    :attr:`magnitude` and :attr:`phase` of all rows are computed at once
+    when first accessed.
+
+    Results without voltages, such as discriminated samples, are kept as a
+    list of objects.
+
+    Args:
+        capacity (int): Number of rows, if known in advance. The I and Q of
+            all rows are then allocated with the first results and filled in
+            place.
+    """
+
+    def __init__(self, capacity: Optional[int] = None):
+        self.capacity = capacity
+        self._chunks = []
+        self._storage = None
+        self._count = 0
+        self._objects = []
+        self._type = None
+
+    @classmethod
+    def gather(cls, rows):
+        """Column of the given ``(column, index)`` rows of other columns."""
+        column = cls()
+        rows = list(rows)
+        if not rows:
+            return column
+        column._type = rows[0][0]._type
+        if rows[0][0]._objects:
+            column._objects = [source._objects[index] for source, index in rows]
+        else:
+            column._chunks = [np.stack([source.iq[index] for source, index in rows])]
+        return column
+
+    def _invalidate(self):
+        for name in ("iq", "magnitude", "phase"):
+            self.__dict__.pop(name, None)
+
+    def extend(self, results):
+        """Append the results of the next executions."""
+        results = list(results)
+        if not results:
+            return
+        if self._type is None:
+            self._type = type(results[0])
+        if not hasattr(results[0], "voltage"):
+            self._objects.extend(results)
+            self._invalidate()
+            return
+
+        voltage = np.stack([np.asarray(result.voltage) for result in results])
+        if self.capacity is None:
+            chunk = np.empty((len(results), 2) + voltage.shape[1:], dtype=np.float32)
+            self._chunks.append(chunk)
+        else:
+            if self._storage is None:
+                self._storage = np.full(
+                    (self.capacity, 2) + voltage.shape[1:], np.nan, dtype=np.float32
+                )
+            end = self._count + len(results)
+            if end > self.capacity:
+                raise_error(
+                    ValueError,
+                    f"Cannot store {end} rows in a column of capacity {self.capacity}.",
+                )
+            chunk = self._storage[self._count : end]
+            self._count = end
+        chunk[:, 0] = voltage.real
+        chunk[:, 1] = voltage.imag
+        self._invalidate()
+
+    def append(self, result):
+        self.extend([result])
+
+    def __len__(self):
+        if self._objects:
+            return len(self._objects)
+        if self._storage is not None:
+            return self._count
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self._objects:
+            return self._objects[index]
+        row = self.iq[index]
+        return self._type(row[0] + 1j * row[1])
+
+    @cached_property
+    def iq(self) -> np.ndarray:
+        """I and Q of shape ``(len(self), 2, ...)``."""
+        if self._storage is not None:
+            return self._storage[: self._count]
+        if len(self._chunks) > 1:
+            self._chunks = [np.concatenate(self._chunks)]
+        if not self._chunks:
+            return np.empty((0, 2), dtype=np.float32)
+        return self._chunks[0]
+
+    @property
+    def voltage_i(self) -> np.ndarray:
+        return self.iq[:, 0]
+
+    @property
+    def voltage_q(self) -> np.ndarray:
+        return self.iq[:, 1]
+
+    @property
+    def voltage(self) -> np.ndarray:
+        return self.voltage_i + 1j * self.voltage_q
+
+    @cached_property
+    def magnitude(self) -> np.ndarray:
+        """Signal magnitude of every row."""
+        if self._objects:
+            return np.array([result.magnitude for result in self._objects])
+        return np.hypot(self.voltage_i, self.voltage_q)
+
+    @cached_property
+    def phase(self) -> np.ndarray:
+        """Signal phase of every row."""
+        if self._objects:
+            return np.array([result.phase for result in self._objects])
+        return np.arctan2(self.voltage_q, self.voltage_i)
@@ -0,0 +1,248 @@
+"""Append-only results stored on disk as they are acquired."""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+from qibo.config import log, raise_error
+
+
+class ResultStore:
+    """Array on disk filled point by point, surviving crashes and preemption.
+
+    The data is a memory-mapped ``.npy`` file that :func:`numpy.load` reads
+    at any time, with NaN for points not acquired yet. The number of stored
+    points is kept in a ``.progress`` file next to it, updated only after
+    the data is flushed, so reopening a store resumes after the last
+    complete point.
+
+    Example:
+        .. code-block:: python
+
+            store = ResultStore("Hahn_echo.npy", len(times))
+            for t in times[len(store):]:
+                ...
+                store.append(magnitude)
+
+    Args:
+        path (str): Path of the ``.npy`` file.
+        shape (int or tuple): Shape of the full results, the first axis
+            being the one filled in order.
+        dtype: Data type of the results.
+    """
+
+    def __init__(self, path, shape, dtype=np.float64):
+        path = Path(path)
+        if path.suffix != ".npy":
+            path = path.with_name(path.name + ".npy")
+        self.path = path
+        self.progress_path = path.with_name(path.name + ".progress")
+
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        if path.exists():
+            self._data = np.lib.format.open_memmap(path, mode="r+")
+            if self._data.shape != shape or self._data.dtype != np.dtype(dtype):
+                raise_error(
+                    ValueError,
+                    f"Existing results {path} have shape {self._data.shape} and "
+                    f"type {self._data.dtype}, expected {shape} and {np.dtype(dtype)}.",
+                )
+            self._count = self._read_progress()
+        else:
+            self._data = np.lib.format.open_memmap(
+                path, mode="w+", dtype=dtype, shape=shape
+            )
+            if np.issubdtype(self._data.dtype, np.inexact):
+                self._data[:] = np.nan
+            self._count = 0
+            self._flush()
+
+    def __len__(self):
+        """Number of points already stored."""
+        return self._count
+
+    @property
+    def shape(self):
+        return self._data.shape
+
+    @property
+    def complete(self) -> bool:
+        return self._count == self.shape[0]
+
+    @property
+    def data(self) -> np.ndarray:
+        """Points stored so far."""
+        return self._data[: self._count]
+
+    def _read_progress(self):
+        if not self.progress_path.exists():
+            return 0
+        return int(self.progress_path.read_text())
+
+    def _flush(self):
+        self._data.flush()
+        # replacing the file is atomic, a crash leaves the old count
+        tmp = self.progress_path.with_name(self.progress_path.name + ".tmp")
+        tmp.write_text(str(self._count))
+        os.replace(tmp, self.progress_path)
+
+    def rewind(self, count: int):
+        """Forget the points after the first ``count``."""
+        self._count = min(count, self._count)
+        self._flush()
+
+    def append(self, values):
+        """Store the next point."""
+        self.extend([values])
+
+    def extend(self, values):
+        """Store the next points, e.g. a whole batch."""
+        values = np.asarray(values)
+        end = self._count + len(values)
+        if end > self.shape[0]:
+            raise_error(
+                ValueError,
+                f"Cannot store {len(values)} points, only "
+                f"{self.shape[0] - self._count} left in {self.path}.",
+            )
+        self._data[self._count : end] = values
+        self._count = end
+        self._flush()
+
+
+class SweepCheckpoint:
+    """Results of named sweeps kept in a directory, so that a restarted job
+    skips the points that are already done.
+
+    Each sweep stores the values of every template readout pulse in a
+    :class:`ResultStore`: the magnitudes of integrated or raw results, the
+    samples of single shot discriminated results, or the statistical
+    frequencies of averaged discriminated results. The ``index.json`` file records, for each sweep, its
+    number of points, readout serials and a description of the sweep, such
+    as the plan shape and the execution options, checked before resuming.
+
+    Example:
+        .. code-block:: python
+
+            checkpoint = SweepCheckpoint("./data")
+            for CRTL, TGT in pairs:
+                results = platform.execute_sweep(
+                    plan, opts, checkpoint=checkpoint, name=f"cr_{CRTL}{TGT}"
+                )
+
+    Args:
+        directory (str): Directory holding the results of all sweeps.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.directory / "index.json"
+        if self.index_path.exists():
+            self.index = json.loads(self.index_path.read_text())
+        else:
+            self.index = {}
+        self._stores = {}
+
+    def _write_index(self):
+        tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+        tmp.write_text(json.dumps(self.index, indent=2))
+        os.replace(tmp, self.index_path)
+
+    def stores(self, name):
+        """Stores of a sweep, by readout serial."""
+        if name not in self._stores:
+            entry = self.index[name]
+            stores = {
+                serial: ResultStore(
+                    self.directory / f"{name}_{i}",
+                    [entry["npoints"]] + entry["shape"],
+                )
+                for i, serial in enumerate(entry["readouts"])
+            }
+            # a crash may leave some stores one batch ahead of the others
+            done = min(len(store) for store in stores.values())
+            for store in stores.values():
+                store.rewind(done)
+            self._stores[name] = stores
+        return self._stores[name]
+
+    def check(self, name, npoints, readouts, description, restart=False):
+        """Make sure the stored points of a sweep belong to the same sweep
+        before resuming it.
+
+        Args:
+            name (str): Name of the sweep.
+            npoints (int): Total number of points of the sweep.
+            readouts (list): Serials of the template readout pulses.
+            description (dict): JSON serializable description of the sweep.
+            restart (bool): If ``True`` the points of a different sweep stored
+                under the same name are discarded, otherwise an error is
+                raised.
+        """
+        entry = self.index.get(name)
+        if entry is None:
+            return
+        stored = (entry["npoints"], entry["readouts"], entry.get("description"))
+        # compare with the JSON form, as tuples are loaded back as lists
+        expected = json.loads(json.dumps((npoints, list(readouts), description)))
+        if tuple(expected) == stored:
+            return
+        if not restart:
+            raise_error(
+                ValueError,
+                f"Sweep {name} in {self.directory} was stored for a different "
+                "plan or options, use another name or restart it.",
+            )
+        log.warning(f"Discarding the stored points of the previous sweep {name}.")
+        self.discard(name)
+
+    def discard(self, name):
+        """Remove the results of a sweep."""
+        entry = self.index.pop(name, None)
+        self._stores.pop(name, None)
+        if entry is None:
+            return
+        for i in range(len(entry["readouts"])):
+            path = self.directory / f"{name}_{i}.npy"
+            for file in (path, path.with_name(path.name + ".progress")):
+                file.unlink(missing_ok=True)
+        self._write_index()
+
+    def done(self, name) -> int:
+        """Number of points of the sweep already acquired."""
+        if name not in self.index:
+            return 0
+        return min(len(store) for store in self.stores(name).values())
+
+    def complete(self, name) -> bool:
+        """Whether all points of the sweep are acquired."""
+        return name in self.index and self.done(name) == self.index[name]["npoints"]
+
+    def record(self, name, npoints, values, description=None):
+        """Store the next points of a sweep.
+
+        Args:
+            name (str): Name of the sweep.
+            npoints (int): Total number of points of the sweep.
+            values (dict): Map from readout serials to the values of the new
+                points.
+            description (dict): Description of the sweep, see :meth:`check`.
+        """
+        if name not in self.index:
+            first = np.asarray(next(iter(values.values()))[0])
+            self.index[name] = {
+                "npoints": npoints,
+                "shape": list(first.shape),
+                "readouts": list(values),
+                "description": description,
+            }
+            self._write_index()
+        stores = self.stores(name)
+        for serial, point_values in values.items():
+            stores[serial].extend(point_values)
+
+    def load(self, name):
+        """Values of the points acquired so far, by readout serial."""
+        return {serial: store.data for serial, store in self.stores(name).items()}
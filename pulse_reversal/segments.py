@@ -0,0 +1,192 @@
+"""Declarative description of piecewise time-resolved experiments.
+
+Replaces the hand-built ``times_idle_1``, ``times_pulse``, ... grids: the
+experiment is a list of segments, each sampled with its own number of
+points, and every point reads out the qubits at that time.
+
+Example:
+    .. code-block:: python
+
+        experiment = SegmentedExperiment(
+            qubit=Q2,
+            segments=[
+                Idle(200, 10),
+                Drive(finish_t, 20, amplitude_scale=3),
+                Idle(200, 10),
+                InvertedDrive(finish_t, 20, amplitude_scale=3),
+                Idle(200, 10),
+            ],
+        )
+        results = experiment.execute(platform, opts)
+        expectations = [res.magnitude for res in results[Q2]]
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+from qibo.config import raise_error
+
+from qibolab.pulses import PulseSequence
+
+from platform_with_RY import delayed_copy
+from sweep_plan import SweepPlan
+
+
+@dataclass
+class Segment:
+    """Time interval sampled with ``npoints`` readouts, edges included."""
+
+    duration: float
+    """Duration of the segment in ns."""
+    npoints: int
+    """Number of readout times in the segment."""
+
+
+@dataclass
+class Idle(Segment):
+    """Segment without pulses."""
+
+
+@dataclass
+class Drive(Segment):
+    """Segment driving the qubit, read out while the drive is played."""
+
+    amplitude_scale: float = 1
+    """Factor applied to the amplitude of the native drive pulse."""
+
+    @property
+    def sign(self):
+        return 1
+
+
+@dataclass
+class InvertedDrive(Drive):
+    """Drive with opposite amplitude, undoing a previous :class:`Drive`."""
+
+    @property
+    def sign(self):
+        return -1
+
+
+@dataclass
+class Readout:
+    """Qubits read out at every time of the experiment.
+
+    It is not a time segment: it is given as :attr:`SegmentedExperiment.readout`,
+    or as the last item of :attr:`SegmentedExperiment.segments`.
+    """
+
+    qubits: List = field(default_factory=list)
+
+
+@dataclass
+class SegmentedExperiment:
+    """Qubit driven by consecutive segments and read out at every time point.
+
+    At a time inside a drive segment the drive is truncated at that time,
+    while drives of earlier segments are played in full.
+    """
+
+    qubit: object
+    """Driven qubit."""
+    segments: List[Segment]
+    """Idle and drive segments, in time order, optionally followed by a
+    :class:`Readout`."""
+    readout: Optional[Readout] = None
+    """Qubits read out at each time, by default only the driven qubit."""
+    start: float = 0
+    """Start time in ns of the first segment."""
+
+    def __post_init__(self):
+        positions = [
+            index
+            for index, segment in enumerate(self.segments)
+            if isinstance(segment, Readout)
+        ]
+        if not positions:
+            return
+        if positions != [len(self.segments) - 1] or self.readout is not None:
+            raise_error(
+                ValueError,
+                "A Readout can only be given once, after all the time segments.",
+            )
+        self.readout = self.segments[-1]
+        self.segments = self.segments[:-1]
+
+    @property
+    def readout_qubits(self):
+        if self.readout is None:
+            return [self.qubit]
+        return self.readout.qubits
+
+    @property
+    def boundaries(self) -> np.ndarray:
+        """Start of every segment followed by the end of the last one."""
+        durations = [segment.duration for segment in self.segments]
+        return self.start + np.concatenate(([0], np.cumsum(durations)))
+
+    @property
+    def times(self) -> np.ndarray:
+        """Readout times of all segments."""
+        boundaries = self.boundaries
+        return np.concatenate(
+            [
+                np.linspace(begin, end, segment.npoints)
+                for segment, begin, end in zip(
+                    self.segments, boundaries[:-1], boundaries[1:]
+                )
+            ]
+        )
+
+    def durations(self) -> np.ndarray:
+        """Played duration of each drive segment at each time, of shape
+        ``(len(times), len(segments))``."""
+        elapsed = self.times[:, np.newaxis] - self.boundaries[np.newaxis, :-1]
+        full = [segment.duration for segment in self.segments]
+        durations = np.clip(elapsed, 0, full)
+        is_drive = [isinstance(segment, Drive) for segment in self.segments]
+        return durations * np.array(is_drive)
+
+    def sequences(self, platform):
+        """Pulse sequences of all times and their readout serials per qubit."""
+        boundaries = self.boundaries
+        drives = {}
+        for index, segment in enumerate(self.segments):
+            if isinstance(segment, Drive):
+                pulse = platform.create_qubit_drive_pulse(
+                    qubit=self.qubit, start=boundaries[index], duration=0
+                )
+                pulse.amplitude *= segment.sign * segment.amplitude_scale
+                drives[index] = pulse
+        readouts = {
+            qubit: platform.create_qubit_readout_pulse(qubit=qubit, start=0)
+            for qubit in self.readout_qubits
+        }
+
+        sequences = []
+        readout_map = {qubit: [] for qubit in readouts}
+        for t, durations in zip(self.times.tolist(), self.durations().tolist()):
+            sequence = PulseSequence()
+            for index, pulse in drives.items():
+                if durations[index] > 0:
+                    new_pulse = delayed_copy(pulse)
+                    new_pulse.duration = durations[index]
+                    sequence.add(new_pulse)
+            for qubit, pulse in readouts.items():
+                new_pulse = delayed_copy(pulse, t)
+                sequence.add(new_pulse)
+                readout_map[qubit].append(new_pulse.serial)
+            sequences.append(sequence)
+        return sequences, readout_map
+
+    def execute(self, platform, options) -> Dict[object, list]:
+        """Play all times as unrolled batches.
+
+        Returns:
+            Dictionary mapping each readout qubit to the list of results at
+            every time in :attr:`times`.
+        """
+        sequences, readout_map = self.sequences(platform)
+        results = platform.execute_pulse_sequences(sequences, options)
+        return SweepPlan.collect(results, readout_map)
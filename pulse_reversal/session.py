@@ -0,0 +1,101 @@
+"""Platform kept connected across the experiments of a process."""
+
+import atexit
+import os
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from qibo.config import log
+
+PLATFORMS = "QIBOLAB_PLATFORMS"
+
+
+def runcard_fingerprint(name: str):
+    """Modification times and sizes of the files defining a platform.
+
+    Returns ``None`` for platforms without a runcard directory, such as the
+    dummy platform, which then never count as changed.
+    """
+    profiles = os.environ.get(PLATFORMS)
+    if profiles is None:
+        return None
+    directory = Path(profiles) / name
+    if not directory.is_dir():
+        return None
+    return tuple(
+        (path.name, path.stat().st_mtime_ns, path.stat().st_size)
+        for path in sorted(directory.iterdir())
+        if path.is_file()
+    )
+
+
+class PlatformSession:
+    """Connected platform shared by the experiment functions of a process.
+
+    The platform is created and connected on first use and stays connected
+    until :meth:`close`. It is recreated and reconnected only when the files
+    of its runcard change.
+
+    Example:
+        .. code-block:: python
+
+            with PlatformSession("icarusq_iqm5q") as session:
+                for CRTL, TGT in pairs:
+                    cr_pulse_run(CRTL, TGT, platform=session.platform)
+
+    Args:
+        name (str): Name of the platform.
+        factory (callable): Function creating the platform from its name, by
+            default :func:`qibolab_init.create_platform`, which caches the
+            constructed platform.
+    """
+
+    def __init__(self, name: str, factory: Optional[Callable] = None):
+        if factory is None:
+            from qibolab_init import create_platform as factory
+        self.name = name
+        self.factory = factory
+        self._platform = None
+        self._fingerprint = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def platform(self):
+        """Connected platform, rearmed if its runcard changed."""
+        fingerprint = runcard_fingerprint(self.name)
+        if self._platform is not None and fingerprint != self._fingerprint:
+            log.info(f"Runcard of {self.name} changed, reconnecting.")
+            self.close()
+        if self._platform is None:
+            self._platform = self.factory(self.name)
+            self._fingerprint = fingerprint
+        if not self._platform.is_connected:
+            self._platform.connect()
+        return self._platform
+
+    def close(self):
+        """Disconnect the platform, the next access creates it again."""
+        if self._platform is not None:
+            self._platform.disconnect()
+            self._platform = None
+
+
+_sessions: Dict[str, PlatformSession] = {}
+
+
+def get_session(name: str) -> PlatformSession:
+    """Session of a platform shared by the whole process, closed at exit."""
+    if name not in _sessions:
+        _sessions[name] = PlatformSession(name)
+    return _sessions[name]
+
+
+@atexit.register
+def _close_sessions():
+    for session in _sessions.values():
+        session.close()
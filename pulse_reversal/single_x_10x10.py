@@ -4,6 +4,7 @@ drive_qubit = Q2
 
 from qibolab import create_platform, ExecutionParameters, AveragingMode, AcquisitionType
 from qibolab.pulses import PulseSequence
+from readout_utils import execute_and_read_all
 
 opts = ExecutionParameters(
     nshots=1000,
@@ -39,8 +40,9 @@ for t in times:
     ps.add(ro_pulse_q1)
     ps.add(ro_pulse_q2)
     
-    gnd_q1 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q1.serial].magnitude
-    gnd_q2 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q2.serial].magnitude
+    expects = execute_and_read_all(platform, ps, opts)
+    gnd_q1 = expects[ro_pulse_q1.serial]
+    gnd_q2 = expects[ro_pulse_q2.serial]
     baseline_expects_q1.append(gnd_q1)
     baseline_expects_q2.append(gnd_q2)
 
@@ -66,8 +68,9 @@ for amplitude in np.arange(0.1,1.1,0.1):
         ps.add(ro_pulse_q1)
         ps.add(ro_pulse_q2)
         
-        gnd_q1 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q1.serial].magnitude
-        gnd_q2 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q2.serial].magnitude
+        expects = execute_and_read_all(platform, ps, opts)
+        gnd_q1 = expects[ro_pulse_q1.serial]
+        gnd_q2 = expects[ro_pulse_q2.serial]
         x_expects_q1.append(gnd_q1)
         x_expects_q2.append(gnd_q2)
 
@@ -82,8 +85,9 @@ for amplitude in np.arange(0.1,1.1,0.1):
         ps.add(ro_pulse_q1)
         ps.add(ro_pulse_q2)
         
-        gnd_q1 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q1.serial].magnitude
-        gnd_q2 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q2.serial].magnitude
+        expects = execute_and_read_all(platform, ps, opts)
+        gnd_q1 = expects[ro_pulse_q1.serial]
+        gnd_q2 = expects[ro_pulse_q2.serial]
         x_expects_q1.append(gnd_q1)
         x_expects_q2.append(gnd_q2)
     
@@ -4,6 +4,7 @@ drive_qubit = Q2
 
 from qibolab import create_platform, ExecutionParameters, AveragingMode, AcquisitionType
 from qibolab.pulses import PulseSequence
+from readout_utils import execute_and_read_all
 
 opts = ExecutionParameters(
     nshots=1000,
@@ -44,8 +45,9 @@ for t in times:
     ps.add(ro_pulse_q1)
     ps.add(ro_pulse_q2)
     
-    gnd_q1 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q1.serial].magnitude
-    gnd_q2 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q2.serial].magnitude
+    expects = execute_and_read_all(platform, ps, opts)
+    gnd_q1 = expects[ro_pulse_q1.serial]
+    gnd_q2 = expects[ro_pulse_q2.serial]
     baseline_expects_q1.append(gnd_q1)
     baseline_expects_q2.append(gnd_q2)
 
@@ -68,8 +70,9 @@ for t in pulse_times:
     ps.add(ro_pulse_q1)
     ps.add(ro_pulse_q2)
     
-    gnd_q1 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q1.serial].magnitude
-    gnd_q2 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q2.serial].magnitude
+    expects = execute_and_read_all(platform, ps, opts)
+    gnd_q1 = expects[ro_pulse_q1.serial]
+    gnd_q2 = expects[ro_pulse_q2.serial]
     x_expects_q1.append(gnd_q1)
     x_expects_q2.append(gnd_q2)
 
@@ -84,8 +87,9 @@ for t in idle_times:
     ps.add(ro_pulse_q1)
     ps.add(ro_pulse_q2)
     
-    gnd_q1 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q1.serial].magnitude
-    gnd_q2 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q2.serial].magnitude
+    expects = execute_and_read_all(platform, ps, opts)
+    gnd_q1 = expects[ro_pulse_q1.serial]
+    gnd_q2 = expects[ro_pulse_q2.serial]
     x_expects_q1.append(gnd_q1)
     x_expects_q2.append(gnd_q2)
 
@@ -102,8 +106,9 @@ for t in pulse_times_undo:
     ps.add(ro_pulse_q1)
     ps.add(ro_pulse_q2)
     
-    gnd_q1 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q1.serial].magnitude
-    gnd_q2 = platform.execute_pulse_sequence(ps, opts)[ro_pulse_q2.serial].magnitude
+    expects = execute_and_read_all(platform, ps, opts)
+    gnd_q1 = expects[ro_pulse_q1.serial]
+    gnd_q2 = expects[ro_pulse_q2.serial]
     x_expects_q1.append(gnd_q1)
     x_expects_q2.append(gnd_q2)
 
@@ -0,0 +1,270 @@
+"""Sweep plans compiled into batched executions on a :class:`Platform`."""
+
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from qibolab.pulses import Pulse, PulseSequence, ReadoutPulse
+from qibolab.result import (
+    AveragedIntegratedResults,
+    AveragedSampleResults,
+    SampleResults,
+)
+from qibolab.sweeper import Parameter, Sweeper
+
+from platform_with_RY import delayed_copy
+from result_columns import ResultColumn
+
+
+@dataclass
+class SweepAxis:
+    """Single parameter axis of a :class:`SweepPlan`."""
+
+    parameter: Parameter
+    """Pulse parameter that takes the values of the axis."""
+    values: npt.NDArray
+    """Absolute values of the parameter."""
+    pulses: List[Pulse]
+    """Pulses of the template sequence that are swept."""
+    shifted: List[Pulse] = field(default_factory=list)
+    """Pulses of the template sequence that are delayed by the same amount
+    the swept pulses finish later, as the readout in ``04_09/rabi.py``."""
+
+    def __post_init__(self):
+        self.values = np.asarray(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    @classmethod
+    def following(
+        cls,
+        sequence: PulseSequence,
+        pulses: List[Pulse],
+        values,
+        parameter: Parameter = Parameter.duration,
+    ):
+        """Axis of a loop changing ``pulses`` and moving every later pulse of
+        the sequence with their finish, as in
+
+        .. code-block:: python
+
+            for t in sweep:
+                cr_pulse.duration = t
+                tgt_ro_pulse.start = cr_pulse.finish
+
+        The shifted pulses are those starting after the earliest finish of
+        the swept pulses.
+        """
+        finish = min(pulse.finish for pulse in pulses)
+        swept = {id(pulse) for pulse in pulses}
+        shifted = [
+            pulse
+            for pulse in sequence
+            if id(pulse) not in swept and pulse.start >= finish
+        ]
+        return cls(parameter, values, pulses, shifted)
+
+
+@dataclass
+class ControlAxis:
+    """Axis preparing the control qubit in ``|0>`` then ``|1>``.
+
+    Pulses of the axis, such as the control pi pulse of the cross resonance
+    scripts, are played only for the excited state. Placed last in
+    :attr:`SweepPlan.axes`, the two states of each point are consecutive in
+    the same unrolled batch.
+    """
+
+    pulses: List[Pulse]
+    """Pulses played only when the control is excited. They do not need to
+    be in the template sequence."""
+    parameter = None
+
+    @property
+    def values(self) -> np.ndarray:
+        return np.array([0, 1])
+
+    @property
+    def shifted(self) -> List[Pulse]:
+        return []
+
+    def __len__(self):
+        return 2
+
+
+@dataclass
+class SweepPlan:
+    """Template pulse sequence swept over the cartesian product of its axes.
+
+    Example:
+        .. code-block:: python
+
+            ps = PulseSequence(cr_pulse, ro_pulse)
+            plan = SweepPlan(
+                ps, [SweepAxis(Parameter.duration, durations, [cr_pulse], [ro_pulse])]
+            )
+            results = platform.execute_sweep(plan, opts)
+            magnitudes = [res.magnitude for res in results[ro_pulse.serial]]
+
+        With a :class:`ControlAxis` the results reshaped to :attr:`shape`
+        hold the ground and excited control traces:
+
+        .. code-block:: python
+
+            plan = SweepPlan(ps, [axis, ControlAxis([crtl_pi_pulse])])
+            results = platform.execute_sweep(plan, opts)
+            magnitudes = np.reshape(
+                [res.magnitude for res in results[ro_pulse.serial]], plan.shape
+            )
+            gnd, exc = magnitudes[:, 0], magnitudes[:, 1]
+    """
+
+    sequence: PulseSequence
+    """Template sequence, never modified by the plan."""
+    axes: List[Union[SweepAxis, ControlAxis]]
+    """Parameter axes, the last one varying fastest."""
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(axis) for axis in self.axes)
+
+    def __len__(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def sweepers(self) -> Optional[List[Sweeper]]:
+        """Equivalent :class:`qibolab.sweeper.Sweeper` objects, or ``None``
+        when an axis cannot be expressed as a native sweep."""
+        if self._control_axes or any(axis.shifted for axis in self.axes):
+            return None
+        return [Sweeper(axis.parameter, axis.values, axis.pulses) for axis in self.axes]
+
+    @property
+    def linked_sweepers(self) -> Optional[List[Sweeper]]:
+        """Sweepers for controllers that delay the pulses following a pulse
+        whose duration is swept, as sequential real-time programs do.
+
+        Duration axes with shifted pulses become a single duration sweeper,
+        other axes with shifted pulses cannot be swept natively.
+        """
+        if self._control_axes or any(
+            axis.shifted and axis.parameter is not Parameter.duration
+            for axis in self.axes
+        ):
+            return None
+        return [Sweeper(axis.parameter, axis.values, axis.pulses) for axis in self.axes]
+
+    @property
+    def _control_axes(self) -> List[ControlAxis]:
+        return [axis for axis in self.axes if isinstance(axis, ControlAxis)]
+
+    def sequences(self) -> Tuple[List[PulseSequence], Dict[str, List[str]]]:
+        """Materialize one pulse sequence for every point of the sweep.
+
+        Returns:
+            sequences (list): Pulse sequences in sweep order.
+            readout_map (dict): Map from template readout pulse serials to the
+                readout serials of every point.
+        """
+        templates = list(self.sequence)
+        readouts = [pulse for pulse in templates if isinstance(pulse, ReadoutPulse)]
+        in_template = {id(pulse) for pulse in templates}
+        for axis in self._control_axes:
+            templates += [
+                pulse for pulse in axis.pulses if id(pulse) not in in_template
+            ]
+        sequences = []
+        readout_map = {pulse.serial: [] for pulse in readouts}
+        for point in product(*(axis.values for axis in self.axes)):
+            pulses = {id(pulse): delayed_copy(pulse) for pulse in templates}
+            dropped = set()
+            for axis, value in zip(self.axes, point):
+                if isinstance(axis, ControlAxis):
+                    if not value:
+                        dropped.update(id(pulse) for pulse in axis.pulses)
+                    continue
+                for pulse in axis.pulses:
+                    setattr(pulses[id(pulse)], axis.parameter.name, value)
+                if axis.shifted:
+                    delay = max(
+                        pulses[id(pulse)].finish - pulse.finish for pulse in axis.pulses
+                    )
+                for pulse in axis.shifted:
+                    pulses[id(pulse)].start += delay
+            sequences.append(
+                PulseSequence(
+                    *(pulse for key, pulse in pulses.items() if key not in dropped)
+                )
+            )
+            for template, serial in zip(readouts, readout_map):
+                readout_map[serial].append(pulses[id(template)].serial)
+        return sequences, readout_map
+
+    @staticmethod
+    def collect(results, readout_map):
+        """Rearrange the results of the materialized sequences per template
+        readout pulse, in sweep order."""
+        taken = {}
+        collected = {}
+        for serial, serials in readout_map.items():
+            rows = []
+            for new_serial in serials:
+                index = taken.get(new_serial, 0)
+                rows.append((results[new_serial], index))
+                taken[new_serial] = index + 1
+            if all(isinstance(column, ResultColumn) for column, _ in rows):
+                collected[serial] = ResultColumn.gather(rows)
+            else:
+                collected[serial] = [column[index] for column, index in rows]
+        return collected
+
+    def split(self, results):
+        """Split the results of a native sweep to one result per point."""
+        npoints = len(self)
+        collected = {}
+        for serial, result in results.items():
+            if isinstance(result, AveragedSampleResults):
+                points = zip(
+                    _points(result.statistical_frequency, npoints),
+                    _points(result.samples, npoints),
+                    _points(result.std, npoints),
+                )
+                collected[serial] = [
+                    AveragedSampleResults(frequency, samples, std=std)
+                    for frequency, samples, std in points
+                ]
+            elif isinstance(result, SampleResults):
+                collected[serial] = [
+                    SampleResults(samples)
+                    for samples in _points(result.samples, npoints)
+                ]
+            elif isinstance(result, AveragedIntegratedResults):
+                points = zip(
+                    _points(result.voltage, npoints), _points(result.std, npoints)
+                )
+                collected[serial] = [
+                    type(result)(voltage, std=std) for voltage, std in points
+                ]
+            else:
+                collected[serial] = [
+                    type(result)(voltage)
+                    for voltage in _points(result.voltage, npoints)
+                ]
+        return collected
+
+
+def _points(data, npoints: int) -> List[np.ndarray]:
+    """Split the data of a native sweep, with the sweep axes last, to one
+    array per point. Empty data, such as a missing ``std``, stays empty."""
+    data = np.asarray(data)
+    if data.size == 0:
+        return [data] * npoints
+    if data.size == npoints:
+        data = data.reshape(npoints)
+    else:
+        data = data.reshape(-1, npoints)
+    return [data[..., i] for i in range(npoints)]
@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# the modules of pulse_reversal import each other as top level modules
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from qibolab.dummy import create_dummy  # noqa: E402
+
+from platform_with_RY import Platform, Settings  # noqa: E402
+
+
+@pytest.fixture
+def platform():
+    dummy = create_dummy(with_couplers=False)
+    return Platform(
+        dummy.name,
+        dummy.qubits,
+        dummy.pairs,
+        dummy.instruments,
+        settings=Settings(dummy.settings.nshots, dummy.settings.relaxation_time),
+        resonator_type=dummy.resonator_type,
+    )
@@ -0,0 +1,43 @@
+from qibolab.pulses import PulseSequence
+
+from unrolling import BatchLimits
+
+
+def readouts(platform, count):
+    return [PulseSequence(platform.create_MZ_pulse(0, start=0)) for _ in range(count)]
+
+
+def unsupported(sequences):
+    raise RuntimeError("This driver does not split batches.")
+
+
+def test_split_batches_without_limits(platform, monkeypatch):
+    for controller in platform._controllers.values():
+        monkeypatch.setattr(controller, "split_batches", unsupported)
+    batches = list(platform.split_batches(readouts(platform, 6), 1000))
+    assert [len(batch) for batch in batches] == [6]
+
+
+def test_split_batches_with_limits(platform):
+    platform.batch_limits = {
+        name: BatchLimits(max_readouts=4) for name in platform._controllers
+    }
+    batches = list(platform.split_batches(readouts(platform, 6), 1000))
+    assert [len(batch) for batch in batches] == [4, 2]
+
+
+def test_split_batches_of_driver(platform, monkeypatch):
+    def fixed_size(sequences):
+        return [sequences[i : i + 4] for i in range(0, len(sequences), 4)]
+
+    for controller in platform._controllers.values():
+        monkeypatch.setattr(controller, "split_batches", fixed_size)
+    batches = list(platform.split_batches(readouts(platform, 10), 1000))
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+
+    # configured limits replace those of the driver
+    platform.batch_limits = {
+        name: BatchLimits(max_readouts=5) for name in platform._controllers
+    }
+    batches = list(platform.split_batches(readouts(platform, 10), 1000))
+    assert [len(batch) for batch in batches] == [5, 5]
@@ -0,0 +1,99 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from qibolab.execution_parameters import (
+    AcquisitionType,
+    AveragingMode,
+    ExecutionParameters,
+)
+from qibolab.pulses import PulseSequence
+from qibolab.sweeper import Parameter
+
+from result_store import SweepCheckpoint
+from sweep_plan import SweepAxis, SweepPlan
+from unrolling import BatchLimits
+
+OPTIONS = ExecutionParameters(
+    nshots=10,
+    relaxation_time=100,
+    acquisition_type=AcquisitionType.INTEGRATION,
+    averaging_mode=AveragingMode.CYCLIC,
+)
+
+
+def cr_plan(platform, durations):
+    drive = platform.create_RX_pulse(1, start=5)
+    readout = platform.create_MZ_pulse(1, start=drive.finish)
+    axis = SweepAxis(Parameter.duration, durations, [drive], [readout])
+    return SweepPlan(PulseSequence(drive, readout), [axis]), readout
+
+
+@pytest.fixture
+def interrupted(platform, tmp_path, monkeypatch):
+    """Platform whose sweep stopped after two batches of three points."""
+    platform.batch_limits = {
+        name: BatchLimits(max_sequences=3) for name in platform._controllers
+    }
+    plan, _ = cr_plan(platform, np.arange(0, 200, 20))
+    execute = platform.execute_pulse_sequences
+    calls = []
+
+    def stop_third_batch(sequences, options, **kwargs):
+        calls.append(len(sequences))
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        return execute(sequences, options, **kwargs)
+
+    monkeypatch.setattr(platform, "execute_pulse_sequences", stop_third_batch)
+    with pytest.raises(KeyboardInterrupt):
+        platform.execute_sweep(
+            plan, OPTIONS, checkpoint=SweepCheckpoint(tmp_path), name="cr"
+        )
+    monkeypatch.setattr(platform, "execute_pulse_sequences", execute)
+    return platform
+
+
+def test_resume(interrupted, tmp_path):
+    checkpoint = SweepCheckpoint(tmp_path)
+    assert checkpoint.done("cr") == 6
+    plan, readout = cr_plan(interrupted, np.arange(0, 200, 20))
+    results = interrupted.execute_sweep(
+        plan, OPTIONS, checkpoint=checkpoint, name="cr"
+    )
+    assert results[readout.serial].shape == (10,)
+    assert checkpoint.complete("cr")
+
+
+@pytest.mark.parametrize(
+    "durations, options",
+    [
+        (np.arange(0, 300, 20), OPTIONS),
+        (np.arange(0, 200, 20), replace(OPTIONS, nshots=20)),
+    ],
+)
+def test_changed_plan_is_not_resumed(interrupted, tmp_path, durations, options):
+    plan, readout = cr_plan(interrupted, durations)
+    with pytest.raises(ValueError):
+        interrupted.execute_sweep(
+            plan, options, checkpoint=SweepCheckpoint(tmp_path), name="cr"
+        )
+
+    checkpoint = SweepCheckpoint(tmp_path)
+    results = interrupted.execute_sweep(
+        plan, options, checkpoint=checkpoint, name="cr", restart=True
+    )
+    assert results[readout.serial].shape == (len(durations),)
+    assert not np.isnan(results[readout.serial]).any()
+    assert SweepCheckpoint(tmp_path).index["cr"]["npoints"] == len(durations)
+
+
+def test_averaged_discrimination(platform, tmp_path):
+    plan, readout = cr_plan(platform, np.arange(0, 60, 20))
+    options = replace(OPTIONS, acquisition_type=AcquisitionType.DISCRIMINATION)
+    checkpoint = SweepCheckpoint(tmp_path)
+    results = platform.execute_sweep(plan, options, checkpoint=checkpoint, name="cr")
+    probabilities = results[readout.serial]
+    assert probabilities.shape == (3,)
+    assert ((probabilities >= 0) & (probabilities <= 1)).all()
+    assert checkpoint.complete("cr")
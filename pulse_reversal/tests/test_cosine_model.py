@@ -0,0 +1,27 @@
+import numpy as np
+
+from cosine_model import cosine, cosine_jacobian
+
+
+def test_jacobian():
+    x = np.linspace(0, 500, 11)
+    params = np.array([0.4, 0.03, 20.0, 0.5])
+    step = 1e-6 * np.maximum(np.abs(params), 1)
+    numerical = np.stack(
+        [
+            (cosine(x, *(params + dp)) - cosine(x, *(params - dp))) / (2 * s)
+            for dp, s in zip(np.diag(step), step)
+        ],
+        axis=-1,
+    )
+    assert np.allclose(cosine_jacobian(x, *params), numerical, atol=1e-6)
+
+
+def test_batched_parameters():
+    x = np.linspace(0, 500, 11)
+    params = np.array([[0.4, 0.03, 20.0, 0.5], [1.0, 0.01, 0.0, 0.0]])
+    columns = [params[:, i, None] for i in range(4)]
+    jacobian = cosine_jacobian(x, *columns)
+    assert cosine(x, *columns).shape == (2, 11)
+    assert jacobian.shape == (2, 11, 4)
+    assert np.allclose(jacobian[1], cosine_jacobian(x, *params[1]))
@@ -0,0 +1,73 @@
+import pickle
+
+import pytest
+
+import qibolab_init
+
+PLATFORM = """
+from qibolab.dummy import create_dummy
+
+from platform_with_RY import Platform, Settings
+
+
+def create(path=None):
+    dummy = create_dummy(with_couplers=False)
+    return Platform(
+        "fake",
+        dummy.qubits,
+        dummy.pairs,
+        dummy.instruments,
+        settings=Settings(dummy.settings.nshots, dummy.settings.relaxation_time),
+    )
+"""
+
+
+@pytest.fixture
+def platforms(tmp_path, monkeypatch):
+    (tmp_path / "platforms" / "fake").mkdir(parents=True)
+    (tmp_path / "platforms" / "fake" / "platform.py").write_text(PLATFORM)
+    monkeypatch.setenv(qibolab_init.PLATFORMS, str(tmp_path / "platforms"))
+    monkeypatch.setenv(qibolab_init.PLATFORMS_CACHE, str(tmp_path / "cache"))
+    return tmp_path
+
+
+def snapshots(platforms):
+    return sorted(path.name for path in (platforms / "cache").glob("*.pkl"))
+
+
+def test_snapshot_is_loaded(platforms):
+    first = qibolab_init.create_platform("fake")
+    assert len(snapshots(platforms)) == 1
+    second = qibolab_init.create_platform("fake")
+    assert second is not first
+    assert second.settings.relaxation_times == {}
+
+
+def test_platform_classes_are_part_of_the_digest(platforms, monkeypatch):
+    qibolab_init.create_platform("fake")
+    before = snapshots(platforms)
+    monkeypatch.setattr(qibolab_init, "SNAPSHOT_MODULES", ("unrolling",))
+    qibolab_init.create_platform("fake")
+    after = snapshots(platforms)
+    assert len(after) == 1 and after != before
+
+
+def test_snapshots_of_other_paths_are_kept(platforms):
+    for runcard in ("first.yml", "second.yml"):
+        (platforms / runcard).write_text(runcard)
+    qibolab_init.create_platform("fake", path=platforms / "first.yml")
+    qibolab_init.create_platform("fake", path=platforms / "second.yml")
+    qibolab_init.create_platform("fake", path=platforms / "first.yml")
+    qibolab_init.create_platform("fake")
+    assert len(snapshots(platforms)) == 3
+
+
+def test_outdated_snapshot_is_not_loaded(platforms):
+    platform = qibolab_init.create_platform("fake")
+    (snapshot,) = (platforms / "cache").glob("*.pkl")
+    # a snapshot made by older platform classes, under an older digest
+    del platform.settings.relaxation_times
+    outdated = snapshot.with_name(snapshot.name.rsplit("-", 1)[0] + "-old.pkl")
+    outdated.write_bytes(pickle.dumps(platform))
+    snapshot.unlink()
+    assert hasattr(qibolab_init.create_platform("fake").settings, "relaxation_times")
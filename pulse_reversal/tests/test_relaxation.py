@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from qibolab.dummy import create_dummy
+from qibolab.execution_parameters import AcquisitionType, ExecutionParameters
+from qibolab.platform import Settings as QibolabSettings
+from qibolab.pulses import PulseSequence
+from qibolab.sweeper import Parameter, Sweeper
+
+import relaxation_tuner
+from platform_with_RY import RESIDUAL_EXCITATION, Platform, minimal_relaxation_time
+from sweep_plan import SweepAxis, SweepPlan
+
+
+@pytest.fixture
+def stock_platform():
+    """Platform with the settings created by ``qibolab.serialize.load_settings``."""
+    dummy = create_dummy(with_couplers=False)
+    return Platform(
+        dummy.name,
+        dummy.qubits,
+        dummy.pairs,
+        dummy.instruments,
+        settings=QibolabSettings(nshots=10, relaxation_time=1000),
+    )
+
+
+def test_execute_with_stock_settings(stock_platform):
+    platform = stock_platform
+    pulse = platform.create_MZ_pulse(0, start=0)
+    sequence = PulseSequence(pulse)
+    options = ExecutionParameters()
+
+    assert pulse.serial in platform.execute_pulse_sequence(sequence, options)
+    assert len(platform.execute_pulse_sequences([sequence] * 2, options)[0]) == 2
+    sweeper = Sweeper(Parameter.amplitude, np.linspace(0.1, 0.5, 3), [pulse])
+    assert pulse.serial in platform.sweep(sequence, options, sweeper)
+    plan = SweepPlan(sequence, [SweepAxis(Parameter.amplitude, [0.1, 0.2], [pulse])])
+    assert len(platform.execute_sweep(plan, options)[pulse.serial]) == 2
+
+    assert platform.fill_options(options, [0]).relaxation_time == 1000
+    platform.qubits[0].T1 = 1000
+    reset = platform.reset_options(
+        platform.fill_options(ExecutionParameters(fast_reset=True), [0]), [0]
+    )
+    assert reset.relaxation_time == minimal_relaxation_time(1000, RESIDUAL_EXCITATION)
+
+
+def test_tuned_relaxation_times(platform):
+    platform.settings.relaxation_times = {0: 2000, 1: 3000}
+    options = ExecutionParameters()
+    assert platform.fill_options(options, [0, 1]).relaxation_time == 3000
+    # untuned qubits use the default relaxation time
+    default = platform.settings.relaxation_time
+    assert platform.fill_options(options, [0, 2]).relaxation_time == default
+    explicit = ExecutionParameters(relaxation_time=10)
+    assert platform.fill_options(explicit, [0]).relaxation_time == 10
+
+
+def test_tune_stock_settings(stock_platform, monkeypatch):
+    monkeypatch.setattr(
+        relaxation_tuner, "measure_t1", lambda *args: {0: 1000.0, 1: 2000.0}
+    )
+    times = relaxation_tuner.tune_relaxation(stock_platform, [0, 1], [], None)
+    assert stock_platform.settings.relaxation_times == times
+    options = stock_platform.fill_options(ExecutionParameters(), [0, 1])
+    assert options.relaxation_time == minimal_relaxation_time(2000, RESIDUAL_EXCITATION)
+
+
+def test_fit_t1(monkeypatch):
+    delays = np.linspace(0, 5000, 21)
+    magnitudes = relaxation_tuner.decay(delays, 1.0, 1200.0, 0.1)
+    assert relaxation_tuner.fit_t1(delays, magnitudes) == pytest.approx(1200)
+
+    import scipy.optimize
+
+    def undetermined(f, x, y, p0, **kwargs):
+        return np.asarray(p0), np.full((3, 3), np.inf)
+
+    monkeypatch.setattr(scipy.optimize, "curve_fit", undetermined)
+    with pytest.raises(RuntimeError):
+        relaxation_tuner.fit_t1(delays, magnitudes)
+
+
+def test_reject_long_t1(platform, monkeypatch):
+    platform.settings.relaxation_times = {0: 2000}
+    monkeypatch.setattr(relaxation_tuner, "fit_t1", lambda delays, m: 1e6)
+    delays = np.linspace(0, 1000, 3)
+    options = ExecutionParameters(
+        nshots=10, acquisition_type=AcquisitionType.INTEGRATION
+    )
+    assert relaxation_tuner.tune_relaxation(platform, [0, 1], delays, options) == {}
+    assert platform.settings.relaxation_times == {0: 2000}
@@ -0,0 +1,36 @@
+import pytest
+from qibolab.execution_parameters import ExecutionParameters
+
+from segments import Drive, Idle, Readout, SegmentedExperiment
+
+
+def test_readout_after_the_segments(platform):
+    experiment = SegmentedExperiment(
+        qubit=0, segments=[Idle(100, 3), Drive(40, 5), Readout([0, 1])]
+    )
+    assert experiment.readout == Readout([0, 1])
+    assert len(experiment.segments) == 2
+    assert len(experiment.times) == 8
+
+    results = experiment.execute(platform, ExecutionParameters(nshots=10))
+    assert set(results) == {0, 1}
+    assert all(len(qubit_results) == 8 for qubit_results in results.values())
+
+
+@pytest.mark.parametrize(
+    "segments",
+    [
+        [Idle(100, 3), Readout([0]), Drive(40, 5)],
+        [Readout([0]), Readout([1])],
+    ],
+)
+def test_misplaced_readout(segments):
+    with pytest.raises(ValueError):
+        SegmentedExperiment(qubit=0, segments=segments)
+
+
+def test_readout_given_twice():
+    with pytest.raises(ValueError):
+        SegmentedExperiment(
+            qubit=0, segments=[Idle(100, 3), Readout([0])], readout=Readout([1])
+        )
@@ -0,0 +1,11 @@
+import qibolab_init
+from session import PlatformSession
+
+
+def test_session_uses_the_cached_factory():
+    with PlatformSession("dummy") as session:
+        assert session.factory is qibolab_init.create_platform
+        platform = session.platform
+        assert platform.is_connected
+        assert session.platform is platform
+    assert not platform.is_connected
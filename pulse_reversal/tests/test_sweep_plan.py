@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from qibolab.pulses import PulseSequence
+from qibolab.result import (
+    AveragedIntegratedResults,
+    AveragedSampleResults,
+    IntegratedResults,
+    SampleResults,
+)
+from qibolab.sweeper import Parameter
+
+from sweep_plan import SweepAxis, SweepPlan
+
+NSHOTS = 7
+NPOINTS = 5
+
+
+@pytest.fixture
+def plan():
+    axis = SweepAxis(Parameter.amplitude, np.linspace(0, 1, NPOINTS), [])
+    return SweepPlan(PulseSequence(), [axis])
+
+
+def test_split_integrated(plan):
+    voltage = np.random.rand(NSHOTS, NPOINTS) + 1j * np.random.rand(NSHOTS, NPOINTS)
+    points = plan.split({"ro": IntegratedResults(voltage)})["ro"]
+    assert len(points) == NPOINTS
+    assert all(type(point) is IntegratedResults for point in points)
+    np.testing.assert_array_equal(points[2].voltage, voltage[:, 2])
+
+
+def test_split_averaged_integrated(plan):
+    voltage = np.random.rand(NPOINTS) + 1j * np.random.rand(NPOINTS)
+    std = np.random.rand(NPOINTS)
+    points = plan.split({"ro": AveragedIntegratedResults(voltage, std)})["ro"]
+    assert all(type(point) is AveragedIntegratedResults for point in points)
+    assert points[3].voltage == voltage[3]
+    assert points[3].std == std[3]
+
+
+def test_split_samples(plan):
+    samples = np.random.randint(2, size=(NSHOTS, NPOINTS))
+    points = plan.split({"ro": SampleResults(samples)})["ro"]
+    assert all(type(point) is SampleResults for point in points)
+    np.testing.assert_array_equal(points[1].samples, samples[:, 1])
+
+
+def test_split_averaged_samples(plan):
+    frequency = np.random.rand(NPOINTS)
+    std = np.random.rand(NPOINTS)
+    points = plan.split({"ro": AveragedSampleResults(frequency, std=std)})["ro"]
+    assert all(type(point) is AveragedSampleResults for point in points)
+    assert points[4].statistical_frequency == frequency[4]
+    assert points[4].std == std[4]
+    assert points[4].samples.size == 0
+    assert points[4].probability(1) == frequency[4]
@@ -0,0 +1,50 @@
+import pytest
+from qibolab.execution_parameters import AcquisitionType, ExecutionParameters
+from qibolab.pulses import PulseSequence
+
+from platform_with_RY import interleave_sequences, unroll_sequences
+
+
+def two_qubit_sequences(platform, count):
+    sequences = []
+    for i in range(count):
+        drive = platform.create_RX_pulse(0, start=0)
+        drive.duration = 10 * (i + 1)
+        sequences.append(
+            PulseSequence(
+                drive,
+                platform.create_MZ_pulse(0, start=drive.finish),
+                platform.create_MZ_pulse(1, start=0),
+            )
+        )
+    return sequences
+
+
+@pytest.mark.parametrize("unroll", [unroll_sequences, interleave_sequences])
+def test_readouts_in_sequence_order(platform, unroll):
+    sequences = two_qubit_sequences(platform, 3)
+    sequence, readout_map, readouts = unroll(sequences, 1000)
+    assert [(serial, qubit) for serial, qubit, _ in readouts] == [
+        (pulse.serial, pulse.qubit)
+        for template in sequences
+        for pulse in template.ro_pulses
+    ]
+    for serial, new_serials in readout_map.items():
+        assert [new for old, _, new in readouts if old == serial] == new_serials
+    assert {new for _, _, new in readouts} == {p.serial for p in sequence.ro_pulses}
+
+
+@pytest.mark.parametrize("interleave", [False, True])
+def test_execute_collects_every_readout(platform, interleave):
+    sequences = two_qubit_sequences(platform, 3)
+    options = ExecutionParameters(
+        nshots=10, acquisition_type=AcquisitionType.INTEGRATION
+    )
+    results = platform.execute_pulse_sequences(
+        sequences, options, interleave=interleave
+    )
+    idle_readout, drive_readout = sequences[0].ro_pulses
+    assert len(results[drive_readout.serial]) == 1
+    # the readouts of qubit 1 are the same pulse in every sequence
+    assert len(results[idle_readout.serial]) == 3
+    assert len(results[0]) == len(results[1]) == 3
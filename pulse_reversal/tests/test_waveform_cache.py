@@ -0,0 +1,65 @@
+import copy
+import pickle
+
+import numpy as np
+from qibolab.execution_parameters import ExecutionParameters
+from qibolab.pulses import Drag, Gaussian, PulseSequence, Rectangular
+
+from waveform_cache import CachedShape, WaveformCache, cached_shape
+
+
+def test_drivers_see_the_original_shape(platform):
+    drive = platform.create_RX_pulse(0, start=0)
+    flux = platform.create_qubit_flux_pulse(0, start=0, duration=40)
+    assert isinstance(drive.shape, CachedShape)
+    assert isinstance(drive.shape, Gaussian)
+    assert drive.shape.name == "Gaussian"
+    assert drive.shape.rel_sigma == drive.shape.plain().rel_sigma
+    assert isinstance(flux.shape, Rectangular)
+    assert repr(flux.shape) == "Rectangular()"
+
+    drag = cached_shape(Drag(5, 0.1), WaveformCache())
+    assert (drag.name, drag.rel_sigma, drag.beta) == ("Drag", 5, 0.1)
+
+
+def test_envelopes_are_shared(platform):
+    cache = platform.waveform_cache
+    first = platform.create_qubit_drive_pulse(0, start=0, duration=40)
+    second = platform.create_qubit_drive_pulse(0, start=100, duration=40)
+    waveform = first.envelope_waveform_i(platform.sampling_rate)
+    assert second.envelope_waveform_i(platform.sampling_rate) is waveform
+    assert (cache.misses, cache.hits) == (1, 1)
+    np.testing.assert_allclose(
+        waveform.data, first.shape.plain().envelope_waveform_i().data
+    )
+
+
+def test_copies_and_equality(platform):
+    pulse = platform.create_RX_pulse(0, start=0)
+    plain = pulse.shape.plain()
+    assert pulse.shape == plain and plain == pulse.shape
+    for shape in (copy.copy(pulse.shape), copy.deepcopy(pulse.shape)):
+        assert type(shape) is type(pulse.shape)
+        assert shape._cache is pulse.shape._cache
+    restored = pickle.loads(pickle.dumps(pulse.shape))
+    assert isinstance(restored, Gaussian) and restored == plain
+
+
+def test_execute_with_cached_shapes(platform):
+    drive = platform.create_RX_pulse(0, start=0)
+    readout = platform.create_MZ_pulse(0, start=drive.finish)
+    results = platform.execute_pulse_sequences(
+        [PulseSequence(drive, readout)] * 3, ExecutionParameters(nshots=10)
+    )
+    assert len(results[readout.serial]) == 3
+
+
+def test_unrolled_placements_share_samples(platform):
+    sequences = [
+        PulseSequence(platform.create_MZ_pulse(0, start=start))
+        for start in range(0, 1000, 100)
+    ]
+    sequence, _ = platform._unroll_batch(sequences, 1000)
+    rate = platform.sampling_rate
+    waveforms = {id(pulse.envelope_waveform_i(rate).data) for pulse in sequence}
+    assert len(waveforms) == 1
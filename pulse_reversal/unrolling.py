@@ -0,0 +1,107 @@
+"""Utilities for packing sequences into unrolled batches.
+
+Batches are filled up to the resources that each controller actually has,
+instead of the fixed batch sizes of the instrument drivers.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from qibolab.pulses import PulseSequence, PulseType
+
+RESOURCES = ("samples", "readouts", "duration", "sequences")
+"""Resources consumed by each sequence in an unrolled batch."""
+
+
+@dataclass
+class BatchLimits:
+    """Resources of a controller available to a single unrolled sequence.
+
+    Limits left to ``None`` are not enforced.
+    """
+
+    max_samples: Optional[int] = None
+    """Waveform memory, as the total number of I and Q samples of the pulses
+    played by the controller."""
+    max_readouts: Optional[int] = None
+    """Maximum number of readout pulses acquired by the controller."""
+    max_duration: Optional[float] = None
+    """Maximum duration in ns of the unrolled sequence, relaxation included.
+
+    Relevant for controllers that store the whole timeline, such as the
+    IcarusQ RFSoC.
+    """
+    max_sequences: Optional[int] = None
+    """Maximum number of sequences in a batch."""
+
+    @property
+    def array(self):
+        """Limits ordered as :data:`RESOURCES`, with ``inf`` for no limit."""
+        limits = (
+            self.max_samples,
+            self.max_readouts,
+            self.max_duration,
+            self.max_sequences,
+        )
+        return np.array([np.inf if limit is None else limit for limit in limits])
+
+
+def sequence_costs(
+    sequences: List[PulseSequence],
+    owners: Dict[str, str],
+    sampling_rates: Dict[str, float],
+    relaxation_time: int,
+):
+    """Estimate the resources each sequence consumes on each controller.
+
+    Args:
+        sequences (list): List of :class:`qibolab.pulses.PulseSequence` objects.
+        owners (dict): Map from channel names to the name of the controller
+            playing them. Pulses on channels without owner are charged to
+            every controller.
+        sampling_rates (dict): Sampling rate in GSps of each controller.
+        relaxation_time (int): Time in ns between sequences in the unrolled batch.
+
+    Returns:
+        Array of shape ``(len(sequences), len(sampling_rates), len(RESOURCES))``.
+    """
+    controllers = {name: i for i, name in enumerate(sampling_rates)}
+    rates = np.array(list(sampling_rates.values()))
+    costs = np.zeros((len(sequences), len(controllers), len(RESOURCES)))
+    costs[:, :, 3] = 1
+    for i, sequence in enumerate(sequences):
+        costs[i, :, 2] = sequence.finish + relaxation_time
+        for pulse in sequence:
+            owner = controllers.get(owners.get(pulse.channel), slice(None))
+            costs[i, owner, 0] += 2 * pulse.duration
+            if pulse.type is PulseType.READOUT:
+                costs[i, owner, 1] += 1
+    costs[:, :, 0] *= rates
+    return costs
+
+
+def pack_batches(sequences: List[PulseSequence], costs, limits):
+    """Split sequences to the fewest batches of consecutive sequences that fit
+    the limits of every controller.
+
+    The order of the sequences is preserved, which makes filling each batch
+    as much as possible optimal. A sequence exceeding the limits on its own is
+    placed alone in its batch.
+
+    Args:
+        sequences (list): List of :class:`qibolab.pulses.PulseSequence` objects.
+        costs (np.ndarray): Output of :func:`sequence_costs`.
+        limits (np.ndarray): Limits of shape ``(ncontrollers, len(RESOURCES))``.
+    """
+    used = np.zeros_like(limits)
+    batch = []
+    for sequence, cost in zip(sequences, costs):
+        if batch and np.any(used + cost > limits):
+            yield batch
+            used, batch = np.zeros_like(limits), []
+        batch.append(sequence)
+        used += cost
+    if batch:
+        yield batch
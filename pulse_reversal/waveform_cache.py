@@ -0,0 +1,174 @@
+"""Cache of pulse envelopes shared by all pulses created by a platform."""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+from qibolab.pulses import SAMPLING_RATE, Custom, PulseShape
+
+
+class WaveformCache:
+    """Least recently used cache of pulse envelopes, bounded in memory.
+
+    Envelopes are keyed by (shape, duration, amplitude, frequency,
+    relative_phase, sampling_rate), so pulses that differ only in start
+    time, or that are recreated with the same parameters, share their
+    samples.
+
+    Args:
+        max_bytes (int): Memory available to the cached samples.
+    """
+
+    def __init__(self, max_bytes: int = 2**28):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._waveforms = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._waveforms)
+
+    def __repr__(self):
+        return (
+            f"WaveformCache({len(self)} envelopes, {self.nbytes} bytes, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    @staticmethod
+    def key(pulse, shape: PulseShape, sampling_rate):
+        """Parameters that determine the envelopes of a pulse."""
+        if isinstance(shape, Custom):
+            # the representation of custom shapes shows only a few samples
+            digest = hashlib.sha1(shape.envelope_i.tobytes())
+            digest.update(shape.envelope_q.tobytes())
+            shape_key = digest.hexdigest()
+        else:
+            shape_key = repr(shape)
+        return (
+            shape_key,
+            pulse.duration,
+            pulse.amplitude,
+            pulse.frequency,
+            pulse.relative_phase,
+            sampling_rate,
+        )
+
+    def envelopes(self, pulse, shape: PulseShape, sampling_rate=SAMPLING_RATE):
+        """The i and q envelope waveforms of a pulse with the given shape.
+
+        The returned samples are shared and must not be modified.
+        """
+        key = self.key(pulse, shape, sampling_rate)
+        with self._lock:
+            waveforms = self._waveforms.get(key)
+            if waveforms is not None:
+                self.hits += 1
+                self._waveforms.move_to_end(key)
+                return waveforms
+
+        # cached shapes compute their envelopes with their original class
+        base = getattr(shape, "_base", type(shape))
+        waveforms = (
+            base.envelope_waveform_i(shape, sampling_rate),
+            base.envelope_waveform_q(shape, sampling_rate),
+        )
+        for waveform in waveforms:
+            waveform.data.flags.writeable = False
+
+        with self._lock:
+            self.misses += 1
+            if key not in self._waveforms:
+                self._waveforms[key] = waveforms
+                self.nbytes += sum(waveform.data.nbytes for waveform in waveforms)
+            while self.nbytes > self.max_bytes and len(self._waveforms) > 1:
+                _, evicted = self._waveforms.popitem(last=False)
+                self.nbytes -= sum(waveform.data.nbytes for waveform in evicted)
+        return waveforms
+
+    def __getstate__(self):
+        # pickled platforms start with an empty cache
+        return {"max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def clear(self):
+        """Remove all envelopes and reset the counters."""
+        with self._lock:
+            self._waveforms.clear()
+            self.nbytes = self.hits = self.misses = 0
+
+
+class CachedShape:
+    """Pulse shape that looks its envelopes up in a :class:`WaveformCache`.
+
+    Cached shapes are instances of a subclass of their original shape class,
+    created by :func:`cached_shape`, so the drivers reading ``name``,
+    ``rel_sigma`` or ``beta``, or checking ``isinstance(shape, Rectangular)``,
+    see the original shape. Only the envelope methods are replaced.
+    """
+
+    _base = PulseShape
+    """Original shape class."""
+
+    def plain(self) -> PulseShape:
+        """Copy of the shape as an instance of the original class."""
+        shape = object.__new__(self._base)
+        shape.__dict__.update(self.__dict__)
+        del shape.__dict__["_cache"]
+        return shape
+
+    def envelope_waveform_i(self, sampling_rate=SAMPLING_RATE):
+        return self._cache.envelopes(self.pulse, self, sampling_rate)[0]
+
+    def envelope_waveform_q(self, sampling_rate=SAMPLING_RATE):
+        return self._cache.envelopes(self.pulse, self, sampling_rate)[1]
+
+    def envelope_waveforms(self, sampling_rate=SAMPLING_RATE):
+        return self._cache.envelopes(self.pulse, self, sampling_rate)
+
+    def __copy__(self):
+        shape = object.__new__(type(self))
+        shape.__dict__.update(self.__dict__)
+        return shape
+
+    def __deepcopy__(self, memo):
+        # the cache is shared, as in :meth:`qibolab.pulses.ReadoutPulse.copy`
+        shape = object.__new__(type(self))
+        memo[id(self)] = shape
+        for name, value in self.__dict__.items():
+            if name != "_cache":
+                value = copy.deepcopy(value, memo)
+            shape.__dict__[name] = value
+        return shape
+
+    def __reduce__(self):
+        # the subclasses are created at runtime and cannot be pickled by name
+        return cached_shape, (self.plain(), self._cache)
+
+    def __eq__(self, item) -> bool:
+        if isinstance(item, CachedShape):
+            item = item.plain()
+        return self.plain() == item
+
+
+_cached_classes = {}
+
+
+def cached_shape(shape: PulseShape, cache: WaveformCache) -> CachedShape:
+    """Copy of a shape whose envelopes are looked up in ``cache``."""
+    if isinstance(shape, CachedShape):
+        shape = shape.plain()
+    base = type(shape)
+    if base not in _cached_classes:
+        _cached_classes[base] = type(
+            base.__name__, (CachedShape, base), {"_base": base, "__module__": __name__}
+        )
+    new_shape = object.__new__(_cached_classes[base])
+    new_shape.__dict__.update(shape.__dict__)
+    new_shape._cache = cache
+    return new_shape
+